@@ -9,7 +9,6 @@ from PySide6 import QtCore, QtGui
 from PySide6.QtWidgets import QApplication, QSplashScreen
 
 from . import __version__
-from .main_window import MainWindow, _openmcReload
 
 
 def main():
@@ -53,13 +52,15 @@ def run_app(user_args):
     splash.showMessage("Loading Model...",
                        QtCore.Qt.AlignHCenter | QtCore.Qt.AlignBottom)
     app.processEvents()
+    # importing the main window pulls in openmc and matplotlib, wait until
+    # the splash screen is up (and skip it entirely for --help/--version)
+    from .main_window import MainWindow, _openmcReload, _waitForThread
     # load OpenMC model on another thread
     openmc_args = {'threads': user_args.threads, 'model_path': user_args.model_path}
     loader_thread = Thread(target=_openmcReload, kwargs=openmc_args)
     loader_thread.start()
     # while thread is working, process app events
-    while loader_thread.is_alive():
-        app.processEvents()
+    _waitForThread(loader_thread)
 
     splash.clearMessage()
     splash.showMessage("Starting GUI...",
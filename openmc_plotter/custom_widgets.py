@@ -1,3 +1,4 @@
+from contextlib import contextmanager
 from functools import partial
 import warnings
 
@@ -5,6 +6,20 @@ from PySide6 import QtWidgets, QtCore
 from PySide6.QtWidgets import QFrame
 
 
+@contextmanager
+def blocked_signals(*widgets):
+    """
+    Context manager suppressing the signals of the given widgets, used when
+    syncing widgets to values that are already stored in the model.
+    """
+    previous = [widget.blockSignals(True) for widget in widgets]
+    try:
+        yield
+    finally:
+        for widget, blocked in zip(widgets, previous):
+            widget.blockSignals(blocked)
+
+
 class HorizontalLine(QFrame):
     """
     Custom divider widget used in several layouts as a marker between
@@ -12,12 +12,29 @@ import matplotlib.pyplot as plt
 import numpy as np
 import openmc
 
-from .custom_widgets import HorizontalLine, Expander
+from .custom_widgets import HorizontalLine, Expander, blocked_signals
 from .scientific_spin_box import ScientificDoubleSpinBox
 from .plotmodel import (_SCORE_UNITS, _TALLY_VALUES,
                         _REACTION_UNITS, _SPATIAL_FILTERS)
 
 
+def _makeDoubleSpinBox(parent, lo, hi, decimals, slot, step=None,
+                       value=None):
+    """ Create a QDoubleSpinBox with the given range and precision
+
+    The initial value, if any, is set before ``slot`` is connected.
+    """
+    box = QDoubleSpinBox(parent)
+    box.setDecimals(decimals)
+    box.setRange(lo, hi)
+    if step is not None:
+        box.setSingleStep(step)
+    if value is not None:
+        box.setValue(value)
+    box.valueChanged.connect(slot)
+    return box
+
+
 class PlotterDock(QDockWidget):
     """
     Dock widget with common settings for the plotting application
@@ -88,29 +105,12 @@ class DomainDock(PlotterDock):
 
     def _createOriginBox(self):
 
-        # X Origin
-        self.xOrBox = QDoubleSpinBox()
-        self.xOrBox.setDecimals(9)
-        self.xOrBox.setRange(-99999, 99999)
-        xbox_connector = partial(self.main_window.editSingleOrigin,
-                                 dimension=0)
-        self.xOrBox.valueChanged.connect(xbox_connector)
-
-        # Y Origin
-        self.yOrBox = QDoubleSpinBox()
-        self.yOrBox.setDecimals(9)
-        self.yOrBox.setRange(-99999, 99999)
-        ybox_connector = partial(self.main_window.editSingleOrigin,
-                                 dimension=1)
-        self.yOrBox.valueChanged.connect(ybox_connector)
-
-        # Z Origin
-        self.zOrBox = QDoubleSpinBox()
-        self.zOrBox.setDecimals(9)
-        self.zOrBox.setRange(-99999, 99999)
-        zbox_connector = partial(self.main_window.editSingleOrigin,
-                                 dimension=2)
-        self.zOrBox.valueChanged.connect(zbox_connector)
+        # X, Y and Z Origin
+        self.xOrBox, self.yOrBox, self.zOrBox = (
+            _makeDoubleSpinBox(None, -99999, 99999, 9,
+                               partial(self.main_window.editSingleOrigin,
+                                       dimension=dim))
+            for dim in range(3))
 
         # Origin Form Layout
         self.orLayout = QFormLayout()
@@ -127,16 +127,12 @@ class DomainDock(PlotterDock):
     def _createOptionsBox(self):
 
         # Width
-        self.widthBox = QDoubleSpinBox(self)
-        self.widthBox.setRange(.1, 99999)
-        self.widthBox.setDecimals(9)
-        self.widthBox.valueChanged.connect(self.main_window.editWidth)
+        self.widthBox = _makeDoubleSpinBox(self, .1, 99999, 9,
+                                           self.main_window.editWidth)
 
         # Height
-        self.heightBox = QDoubleSpinBox(self)
-        self.heightBox.setRange(.1, 99999)
-        self.heightBox.setDecimals(9)
-        self.heightBox.valueChanged.connect(self.main_window.editHeight)
+        self.heightBox = _makeDoubleSpinBox(self, .1, 99999, 9,
+                                            self.main_window.editHeight)
 
         # ColorBy
         self.colorbyBox = QComboBox(self)
@@ -156,13 +152,9 @@ class DomainDock(PlotterDock):
             self.main_window.editUniverseLevel)
 
         # Alpha
-        self.domainAlphaBox = QDoubleSpinBox(self)
-        self.domainAlphaBox.setValue(self.model.activeView.domainAlpha)
-        self.domainAlphaBox.setSingleStep(0.05)
-        self.domainAlphaBox.setDecimals(2)
-        self.domainAlphaBox.setRange(0.0, 1.0)
-        self.domainAlphaBox.valueChanged.connect(
-            self.main_window.editPlotAlpha)
+        self.domainAlphaBox = _makeDoubleSpinBox(
+            self, 0.0, 1.0, 2, self.main_window.editPlotAlpha, step=0.05,
+            value=self.model.activeView.domainAlpha)
 
         # Visibility
         self.visibilityBox = QCheckBox(self)
@@ -239,29 +231,42 @@ class DomainDock(PlotterDock):
         self.resGroupBox.setLayout(self.resLayout)
 
     def updateDock(self):
-        self.updateOrigin()
-        self.updateWidth()
-        self.updateHeight()
-        self.updateColorBy()
-        self.updateUniverseLevel()
-        self.updatePlotAlpha()
-        self.updatePlotVisibility()
-        self.updateOutlines()
-        self.updateBasis()
-        self.updateAspectLock()
-        self.updateHRes()
-        self.updateVRes()
-
+        # the model already holds these values, don't echo them back
+        with blocked_signals(self.xOrBox, self.yOrBox, self.zOrBox,
+                             self.widthBox, self.heightBox,
+                             self.colorbyBox, self.universeLevelBox,
+                             self.domainAlphaBox, self.visibilityBox,
+                             self.outlinesBox, self.basisBox,
+                             self.ratioCheck, self.hResBox, self.vResBox):
+            self.updateOrigin()
+            self.updateWidth()
+            self.updateHeight()
+            self.updateColorBy()
+            self.updateUniverseLevel()
+            self.updatePlotAlpha()
+            self.updatePlotVisibility()
+            self.updateOutlines()
+            self.updateBasis()
+            self.updateAspectLock()
+            self.updateHRes()
+            self.updateVRes()
+
+    # the view is the source of these values, so the boxes are updated
+    # without echoing valueChanged back into the main window
     def updateOrigin(self):
-        self.xOrBox.setValue(self.model.activeView.origin[0])
-        self.yOrBox.setValue(self.model.activeView.origin[1])
-        self.zOrBox.setValue(self.model.activeView.origin[2])
+        origin = self.model.activeView.origin
+        with blocked_signals(self.xOrBox, self.yOrBox, self.zOrBox):
+            self.xOrBox.setValue(origin[0])
+            self.yOrBox.setValue(origin[1])
+            self.zOrBox.setValue(origin[2])
 
     def updateWidth(self):
-        self.widthBox.setValue(self.model.activeView.width)
+        with blocked_signals(self.widthBox):
+            self.widthBox.setValue(self.model.activeView.width)
 
     def updateHeight(self):
-        self.heightBox.setValue(self.model.activeView.height)
+        with blocked_signals(self.heightBox):
+            self.heightBox.setValue(self.model.activeView.height)
 
     def updateColorBy(self):
         self.colorbyBox.setCurrentText(self.model.activeView.colorby)
@@ -292,20 +297,27 @@ class DomainDock(PlotterDock):
         self.vResLabel.setDisabled(aspect_lock)
 
     def updateHRes(self):
-        self.hResBox.setValue(self.model.activeView.h_res)
+        with blocked_signals(self.hResBox):
+            self.hResBox.setValue(self.model.activeView.h_res)
 
     def updateVRes(self):
-        self.vResBox.setValue(self.model.activeView.v_res)
+        with blocked_signals(self.vResBox):
+            self.vResBox.setValue(self.model.activeView.v_res)
 
     def revertToCurrent(self):
         cv = self.model.currentView
+        av = self.model.activeView
 
-        self.xOrBox.setValue(cv.origin[0])
-        self.yOrBox.setValue(cv.origin[1])
-        self.zOrBox.setValue(cv.origin[2])
+        # restore the view first and sync the boxes once, instead of letting
+        # each box write its value back through valueChanged
+        av.origin = list(cv.origin)
+        av.width = cv.width
+        av.height = cv.height
+        self.main_window.onRatioChange()
 
-        self.widthBox.setValue(cv.width)
-        self.heightBox.setValue(cv.height)
+        self.updateOrigin()
+        self.updateWidth()
+        self.updateHeight()
 
     def resizeEvent(self, event):
         self.main_window.resizeEvent(event)
@@ -759,12 +771,9 @@ class ColorForm(QWidget):
         self.visibilityBox.stateChanged.connect(visible_connector)
 
         # Alpha value
-        self.alphaBox = QDoubleSpinBox()
-        self.alphaBox.setDecimals(2)
-        self.alphaBox.setRange(0, 1)
-        self.alphaBox.setSingleStep(0.05)
-        alpha_connector = partial(main_window.editTallyAlpha)
-        self.alphaBox.valueChanged.connect(alpha_connector)
+        self.alphaBox = _makeDoubleSpinBox(None, 0, 1, 2,
+                                           main_window.editTallyAlpha,
+                                           step=0.05)
 
         # Color map selector
         self.colormapBox = QComboBox()
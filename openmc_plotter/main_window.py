@@ -5,7 +5,7 @@ import pickle
 from threading import Thread
 
 from PySide6 import QtCore, QtGui
-from PySide6.QtGui import QKeyEvent, QAction
+from PySide6.QtGui import QKeyEvent, QAction, QActionGroup
 from PySide6.QtWidgets import (QApplication, QLabel, QSizePolicy, QMainWindow,
                                QScrollArea, QMessageBox, QFileDialog,
                                QColorDialog, QInputDialog, QWidget,
@@ -27,6 +27,23 @@ from .overlays import ShortcutsOverlay
 from .tools import ExportDataDialog
 
 
+def _waitForThread(thread, interval=50):
+    """ Run a local event loop until ``thread`` has finished
+
+    The thread is polled with a timer instead of spinning on
+    QApplication.processEvents, so the GUI stays responsive without
+    keeping a core busy.
+    """
+    loop = QtCore.QEventLoop()
+    timer = QtCore.QTimer()
+    timer.setInterval(interval)
+    timer.timeout.connect(lambda: thread.is_alive() or loop.quit())
+    timer.start()
+    if thread.is_alive():
+        loop.exec()
+    timer.stop()
+
+
 def _openmcReload(threads=None, model_path='.'):
     # reset OpenMC memory, instances
     openmc.lib.reset()
@@ -49,10 +66,29 @@ class MainWindow(QMainWindow):
         super().__init__()
 
         self.screen = screen_size
+        # keep the cached screen size current instead of querying it on
+        # every plot update
+        primary_screen = QtGui.QGuiApplication.primaryScreen()
+        if primary_screen is not None:
+            primary_screen.geometryChanged.connect(self._updateScreenSize)
         self.font_metric = font
         self.setWindowTitle('OpenMC Plot Explorer')
         self.model_path = Path(model_path)
         self.threads = threads
+        # (currentView, settings key) of the last applied plot
+        self._appliedPlot = None
+        # set when changes are applied while a plot is being generated
+        self._reapply = False
+        # undo, redo or restore requested while a plot is being generated
+        self._pendingAction = None
+        # color picker shared by the color edits, created on first use
+        self._colorPickerDialog = None
+        # called with the color chosen in the open picker
+        self._colorPicked = None
+        # basis the relative bases were last computed for
+        self._relativeBasis = None
+        # maximum window size last set by adjustWindow
+        self._lastMaxSize = None
 
     def loadGui(self, use_settings_pkl=True):
 
@@ -75,6 +111,7 @@ class MainWindow(QMainWindow):
         # Create plot image
         self.plotIm = PlotImage(self.model, self.frame, self)
         self.plotIm.frozen = True
+        self.plotIm.plotGenerated.connect(self._runPendingAction)
         self.frame.setWidget(self.plotIm)
 
         # Dock
@@ -104,12 +141,12 @@ class MainWindow(QMainWindow):
 
         # Status Bar
         self.coord_label = QLabel()
+        self._lastCoords = None
         self.statusBar().addPermanentWidget(self.coord_label)
         self.coord_label.hide()
 
-        # Keyboard overlay
-        self.shortcutOverlay = ShortcutsOverlay(self)
-        self.shortcutOverlay.hide()
+        # Keyboard overlay, created the first time it is shown
+        self.shortcutOverlay = None
 
         # Load Plot
         self.statusBar().showMessage('Generating Plot...')
@@ -128,7 +165,8 @@ class MainWindow(QMainWindow):
         if isinstance(event, QGestureEvent):
             pinch = event.gesture(QtCore.Qt.PinchGesture)
             self.editZoom(self.zoom * pinch.scaleFactor())
-        if isinstance(event, QKeyEvent) and hasattr(self, "shortcutOverlay"):
+        if isinstance(event, QKeyEvent) and \
+           getattr(self, "shortcutOverlay", None) is not None:
             self.shortcutOverlay.event(event)
         return super().event(event)
 
@@ -137,6 +175,9 @@ class MainWindow(QMainWindow):
         self.plotIm._resize()
 
     def toggleShortcuts(self):
+        if self.shortcutOverlay is None:
+            self.shortcutOverlay = ShortcutsOverlay(self)
+            self.shortcutOverlay.hide()
         if self.shortcutOverlay.isVisible():
             self.shortcutOverlay.close()
         else:
@@ -274,10 +315,15 @@ class MainWindow(QMainWindow):
         yz_connector = partial(self.editBasis, 'yz', apply=True)
         self.yzAction.triggered.connect(yz_connector)
 
+        # exclusive group, checking one basis unchecks the others
+        self.basisActions = {'xy': self.xyAction,
+                             'xz': self.xzAction,
+                             'yz': self.yzAction}
+        self.basisGroup = QActionGroup(self)
         self.basisMenu = self.editMenu.addMenu('&Basis')
-        self.basisMenu.addAction(self.xyAction)
-        self.basisMenu.addAction(self.xzAction)
-        self.basisMenu.addAction(self.yzAction)
+        for action in self.basisActions.values():
+            self.basisGroup.addAction(action)
+            self.basisMenu.addAction(action)
         self.basisMenu.aboutToShow.connect(self.updateBasisMenu)
 
         # Edit -> Color By Menu
@@ -313,11 +359,15 @@ class MainWindow(QMainWindow):
         density_connector = partial(self.editColorBy, 'density', apply=True)
         self.densityAction.triggered.connect(density_connector)
 
+        self.colorbyActions = {'cell': self.cellAction,
+                               'material': self.materialAction,
+                               'temperature': self.temperatureAction,
+                               'density': self.densityAction}
+        self.colorbyGroup = QActionGroup(self)
         self.colorbyMenu = self.editMenu.addMenu('&Color By')
-        self.colorbyMenu.addAction(self.cellAction)
-        self.colorbyMenu.addAction(self.materialAction)
-        self.colorbyMenu.addAction(self.temperatureAction)
-        self.colorbyMenu.addAction(self.densityAction)
+        for action in self.colorbyActions.values():
+            self.colorbyGroup.addAction(action)
+            self.colorbyMenu.addAction(action)
 
         self.colorbyMenu.aboutToShow.connect(self.updateColorbyMenu)
 
@@ -430,16 +480,10 @@ class MainWindow(QMainWindow):
         self.redoAction.setText('&Redo ({})'.format(num_subsequent_views))
 
     def updateBasisMenu(self):
-        self.xyAction.setChecked(self.model.currentView.basis == 'xy')
-        self.xzAction.setChecked(self.model.currentView.basis == 'xz')
-        self.yzAction.setChecked(self.model.currentView.basis == 'yz')
+        self.basisActions[self.model.currentView.basis].setChecked(True)
 
     def updateColorbyMenu(self):
-        cv = self.model.currentView
-        self.cellAction.setChecked(cv.colorby == 'cell')
-        self.materialAction.setChecked(cv.colorby == 'material')
-        self.temperatureAction.setChecked(cv.colorby == 'temperature')
-        self.densityAction.setChecked(cv.colorby == 'density')
+        self.colorbyActions[self.model.currentView.colorby].setChecked(True)
 
     def updateViewMenu(self):
         if self.dock.isVisible():
@@ -464,6 +508,7 @@ class MainWindow(QMainWindow):
         cv = self.model.currentView
         # load the view from file
         self.loadViewFile(view_file)
+        self.plotIm.waitForPlot()
         self.plotIm.saveImage(view_file.replace('.pltvw', ''))
 
     # Menu and shared methods
@@ -476,19 +521,22 @@ class MainWindow(QMainWindow):
             # update plot and model settings
             self.updateRelativeBases()
 
-        self.cellsModel = DomainTableModel(self.model.activeView.cells)
-        self.materialsModel = DomainTableModel(self.model.activeView.materials)
+            self.cellsModel = DomainTableModel(self.model.activeView.cells)
+            self.materialsModel = DomainTableModel(self.model.activeView.materials)
 
         openmc_args = {'threads': self.threads, 'model_path': self.model_path}
 
         if reload:
             loader_thread = Thread(target=_openmcReload, kwargs=openmc_args)
+            self.statusBar().showMessage("Reloading model...")
             loader_thread.start()
-            while loader_thread.is_alive():
-                self.statusBar().showMessage("Reloading model...")
-                QApplication.processEvents()
+            _waitForThread(loader_thread)
 
             self.plotIm.model = self.model
+            # the reloaded model has to be plotted even if the view is
+            # unchanged
+            self.model.clearMapCache()
+            self._appliedPlot = None
             self.applyChanges()
 
     def saveImage(self, filename=None):
@@ -587,7 +635,9 @@ class MainWindow(QMainWindow):
         finally:
             self.statusBar().showMessage(message.format(filename), 5000)
 
+        self.model.clearMapCache()
         if self.model.activeView.colorby == 'temperature':
+            self._appliedPlot = None
             self.applyChanges()
 
     def closeStatePoint(self):
@@ -605,30 +655,94 @@ class MainWindow(QMainWindow):
         self.plotIm.updatePixmap()
 
     def updateDataMenu(self):
-        if self.model.statepoint:
+        # the action is created and connected once, then only shown or
+        # hidden, so opening several statepoints doesn't stack up entries
+        if not hasattr(self, "closeStatePointAction"):
+            if not self.model.statepoint:
+                return
             self.closeStatePointAction = QAction("&Close statepoint", self)
             self.closeStatePointAction.setToolTip("Close current statepoint")
             self.closeStatePointAction.triggered.connect(self.closeStatePoint)
             self.dataMenu.addAction(self.closeStatePointAction)
-        elif hasattr(self, "closeStatePointAction"):
-            self.dataMenu.removeAction(self.closeStatePointAction)
-
+        self.closeStatePointAction.setVisible(bool(self.model.statepoint))
+
+    def _plotKey(self):
+        """ Snapshot of the active settings that determine the plot """
+        model = self.model
+        av = model.activeView
+        # data_minmax is computed from the plot, not set by the user
+        view_ind = copy.deepcopy({k: v for k, v in vars(av.view_ind).items()
+                                  if k != 'data_minmax'})
+        view_params = (tuple(av.origin), av.width, av.height, av.h_res,
+                       av.v_res, av.basis, av.level, av.color_overlaps)
+        domains = tuple((id, dom.color, dom.masked, dom.highlight)
+                        for domains in (av.cells, av.materials)
+                        for id, dom in domains.items())
+        tally = (model.statepoint, av.selectedTally,
+                 dict(model.appliedFilters), model.appliedScores,
+                 model.appliedNuclides)
+        return view_params, view_ind, domains, tally
+
+    @QtCore.Slot()
     def applyChanges(self):
-        if self.model.activeView != self.model.currentView:
-            self.statusBar().showMessage('Generating Plot...')
-            QApplication.processEvents()
-            if self.model.activeView.selectedTally is not None:
-                self.tallyDock.updateModel()
-            self.model.storeCurrent()
-            self.model.subsequentViews = []
-            self.plotIm.generatePixmap()
-            self.resetModels()
-            self.showCurrentView()
-            self.statusBar().showMessage('')
-        else:
+        # apply again with the latest settings once the running plot is done
+        if self.plotIm.isGenerating():
+            self._reapply = True
+            return
+
+        if self.model.activeView.selectedTally is not None:
+            self.tallyDock.updateModel()
+
+        # PlotView has no equality, compare the applied settings instead
+        key = self._plotKey()
+        cv = self.model.currentView
+        if self._appliedPlot is not None and \
+           self._appliedPlot[0] is cv and self._appliedPlot[1] == key:
             self.statusBar().showMessage('No changes to apply.', 3000)
+            return
+
+        self.statusBar().showMessage('Generating Plot...')
+        QApplication.processEvents()
+        self.model.storeCurrent()
+        self.model.subsequentViews = []
+        self._setApplyEnabled(False)
+        self.plotIm.generatePixmapAsync(
+            partial(self._onChangesApplied, cv, key))
+
+    def _onChangesApplied(self, previous_view, key):
+        self._setApplyEnabled(True)
+        # a new plot replaces currentView, which invalidates the key
+        if self.model.currentView is not previous_view:
+            self._appliedPlot = (self.model.currentView, key)
+        self.resetModels()
+        self.showCurrentView()
+        self.statusBar().showMessage('')
+
+        if self._reapply:
+            self._reapply = False
+            self.applyChanges()
+
+    def _queueAction(self, action):
+        # the view history can't change under a plot being generated,
+        # run the latest request once it is done
+        self._pendingAction = action
+        self.statusBar().showMessage('Waiting for the plot in progress...')
+
+    def _runPendingAction(self):
+        if self._pendingAction is None or self.plotIm.isGenerating():
+            return
+        action, self._pendingAction = self._pendingAction, None
+        action()
+
+    def _setApplyEnabled(self, enabled):
+        self.dock.applyButton.setEnabled(enabled)
+        self.tallyDock.applyButton.setEnabled(enabled)
 
+    @QtCore.Slot()
     def undo(self):
+        if self.plotIm.isGenerating():
+            self._queueAction(self.undo)
+            return
         self.statusBar().showMessage('Generating Plot...')
         QApplication.processEvents()
 
@@ -643,7 +757,11 @@ class MainWindow(QMainWindow):
         self.redoAction.setDisabled(False)
         self.statusBar().showMessage('')
 
+    @QtCore.Slot()
     def redo(self):
+        if self.plotIm.isGenerating():
+            self._queueAction(self.redo)
+            return
         self.statusBar().showMessage('Generating Plot...')
         QApplication.processEvents()
 
@@ -659,6 +777,9 @@ class MainWindow(QMainWindow):
         self.statusBar().showMessage('')
 
     def restoreDefault(self):
+        if self.plotIm.isGenerating():
+            self._queueAction(self.restoreDefault)
+            return
         if self.model.currentView != self.model.defaultView:
 
             self.statusBar().showMessage('Generating Plot...')
@@ -825,6 +946,7 @@ class MainWindow(QMainWindow):
     def editSingleOrigin(self, value, dimension):
         self.model.activeView.origin[dimension] = value
 
+    @QtCore.Slot(float)
     def editPlotAlpha(self, value):
         self.model.activeView.domainAlpha = value
 
@@ -838,11 +960,13 @@ class MainWindow(QMainWindow):
         if apply:
             self.applyChanges()
 
+    @QtCore.Slot(float)
     def editWidth(self, value):
         self.model.activeView.width = value
         self.onRatioChange()
         self.dock.updateWidth()
 
+    @QtCore.Slot(float)
     def editHeight(self, value):
         self.model.activeView.height = value
         self.onRatioChange()
@@ -853,10 +977,12 @@ class MainWindow(QMainWindow):
         self.onRatioChange()
         self.dock.updateAspectLock()
 
+    @QtCore.Slot(int)
     def editVRes(self, value):
         self.model.activeView.v_res = value
         self.dock.updateVRes()
 
+    @QtCore.Slot(int)
     def editHRes(self, value):
         self.model.activeView.h_res = value
         self.onRatioChange()
@@ -864,25 +990,47 @@ class MainWindow(QMainWindow):
 
     # Color dialog methods:
 
-    def editMaskingColor(self):
-        current_color = self.model.activeView.maskBackground
-        dlg = QColorDialog(self)
+    def _pickColor(self, current_color, callback):
+        """ Open the color picker without blocking the event loop
 
+        Parameters
+        ----------
+        current_color : tuple of int
+            RGB color the picker starts from
+        callback : callable
+            Called with the selected RGB tuple, not called if the picker
+            is cancelled
+        """
+        # one picker is kept for all color edits, it keeps its custom colors
+        # and doesn't have to be rebuilt for every edit
+        if self._colorPickerDialog is None:
+            self._colorPickerDialog = QColorDialog(self)
+            self._colorPickerDialog.colorSelected.connect(self._onColorPicked)
+        self._colorPicked = callback
+        dlg = self._colorPickerDialog
         dlg.setCurrentColor(QtGui.QColor.fromRgb(*current_color))
-        if dlg.exec():
-            new_color = dlg.currentColor().getRgb()[:3]
-            self.model.activeView.maskBackground = new_color
-            self.colorDialog.updateMaskingColor()
+        dlg.open()
+
+    def _onColorPicked(self, color):
+        callback, self._colorPicked = self._colorPicked, None
+        if callback is not None:
+            callback(color.getRgb()[:3])
+
+    def editMaskingColor(self):
+        self._pickColor(self.model.activeView.maskBackground,
+                        self._setMaskingColor)
+
+    def _setMaskingColor(self, new_color):
+        self.model.activeView.maskBackground = new_color
+        self.colorDialog.updateMaskingColor()
 
     def editHighlightColor(self):
-        current_color = self.model.activeView.highlightBackground
-        dlg = QColorDialog(self)
+        self._pickColor(self.model.activeView.highlightBackground,
+                        self._setHighlightColor)
 
-        dlg.setCurrentColor(QtGui.QColor.fromRgb(*current_color))
-        if dlg.exec():
-            new_color = dlg.currentColor().getRgb()[:3]
-            self.model.activeView.highlightBackground = new_color
-            self.colorDialog.updateHighlightColor()
+    def _setHighlightColor(self, new_color):
+        self.model.activeView.highlightBackground = new_color
+        self.colorDialog.updateHighlightColor()
 
     def editAlpha(self, value):
         self.model.activeView.highlightAlpha = value
@@ -891,26 +1039,23 @@ class MainWindow(QMainWindow):
         self.model.activeView.highlightSeed = value
 
     def editOverlapColor(self, apply=False):
-        current_color = self.model.activeView.overlap_color
-        dlg = QColorDialog(self)
-        dlg.setCurrentColor(QtGui.QColor.fromRgb(*current_color))
-        if dlg.exec():
-            new_color = dlg.currentColor().getRgb()[:3]
-            self.model.activeView.overlap_color = new_color
-            self.colorDialog.updateOverlapColor()
+        self._pickColor(self.model.activeView.overlap_color,
+                        partial(self._setOverlapColor, apply=apply))
+
+    def _setOverlapColor(self, new_color, apply=False):
+        self.model.activeView.overlap_color = new_color
+        self.colorDialog.updateOverlapColor()
 
         if apply:
             self.applyChanges()
 
     def editBackgroundColor(self, apply=False):
-        current_color = self.model.activeView.domainBackground
-        dlg = QColorDialog(self)
+        self._pickColor(self.model.activeView.domainBackground,
+                        partial(self._setBackgroundColor, apply=apply))
 
-        dlg.setCurrentColor(QtGui.QColor.fromRgb(*current_color))
-        if dlg.exec():
-            new_color = dlg.currentColor().getRgb()[:3]
-            self.model.activeView.domainBackground = new_color
-            self.colorDialog.updateBackgroundColor()
+    def _setBackgroundColor(self, new_color, apply=False):
+        self.model.activeView.domainBackground = new_color
+        self.colorDialog.updateBackgroundColor()
 
         if apply:
             self.applyChanges()
@@ -1026,40 +1171,36 @@ class MainWindow(QMainWindow):
     def revertDockControls(self):
         self.dock.revertToCurrent()
 
+    def _domainsForKind(self, kind):
+        """ Active view cells or materials for a 'Cell'/'Material' kind """
+        av = self.model.activeView
+        return av.cells if kind == 'Cell' else av.materials
+
     def editDomainColor(self, kind, id):
-        if kind == 'Cell':
-            domain = self.model.activeView.cells
-        else:
-            domain = self.model.activeView.materials
+        domain = self._domainsForKind(kind)
 
         current_color = domain[id].color
-        dlg = QColorDialog(self)
-
-        if isinstance(current_color, tuple):
-            dlg.setCurrentColor(QtGui.QColor.fromRgb(*current_color))
-        elif isinstance(current_color, str):
+        if isinstance(current_color, str):
             current_color = openmc.plots._SVG_COLORS[current_color]
-            dlg.setCurrentColor(QtGui.QColor.fromRgb(*current_color))
-        if dlg.exec():
-            new_color = dlg.currentColor().getRgb()[:3]
-            domain[id].color = new_color
+        elif not isinstance(current_color, tuple):
+            current_color = (255, 255, 255)
+        self._pickColor(current_color,
+                        partial(self._setDomainColor, kind, id))
+
+    def _setDomainColor(self, kind, id, new_color):
+        domain = self._domainsForKind(kind)
 
+        domain[id].color = new_color
         self.applyChanges()
 
     def toggleDomainMask(self, state, kind, id):
-        if kind == 'Cell':
-            domain = self.model.activeView.cells
-        else:
-            domain = self.model.activeView.materials
+        domain = self._domainsForKind(kind)
 
         domain[id].masked = bool(state)
         self.applyChanges()
 
     def toggleDomainHighlight(self, state, kind, id):
-        if kind == 'Cell':
-            domain = self.model.activeView.cells
-        else:
-            domain = self.model.activeView.materials
+        domain = self._domainsForKind(kind)
 
         domain[id].highlight = bool(state)
         self.applyChanges()
@@ -1089,16 +1230,11 @@ class MainWindow(QMainWindow):
         self.colorDialog.setVisible(is_visible)
 
     def resetModels(self):
-        self.cellsModel = DomainTableModel(self.model.activeView.cells)
-        self.materialsModel = DomainTableModel(self.model.activeView.materials)
-        self.cellsModel.beginResetModel()
-        self.cellsModel.endResetModel()
-        self.materialsModel.beginResetModel()
-        self.materialsModel.endResetModel()
+        self.cellsModel.setDomains(self.model.activeView.cells)
+        self.materialsModel.setDomains(self.model.activeView.materials)
         self.colorDialog.updateDomainTabs()
 
     def showCurrentView(self):
-        self.updateScale()
         self.updateRelativeBases()
         self.plotIm.updatePixmap()
 
@@ -1111,46 +1247,55 @@ class MainWindow(QMainWindow):
 
         self.adjustWindow()
 
-    def updateScale(self):
-        cv = self.model.currentView
-        self.scale = (cv.h_res / cv.width,
-                      cv.v_res / cv.height)
-
     def updateRelativeBases(self):
         cv = self.model.currentView
+        if cv.basis == self._relativeBasis:
+            return
+        self._relativeBasis = cv.basis
         self.xBasis = 0 if cv.basis[0] == 'x' else 1
         self.yBasis = 1 if cv.basis[1] == 'y' else 2
         self.zBasis = 3 - (self.xBasis + self.yBasis)
 
+    def _updateScreenSize(self, geometry):
+        self.screen = geometry.size()
+        self.adjustWindow()
+
     def adjustWindow(self):
-        self.setMaximumSize(self.screen.width(), self.screen.height())
+        # called on every move/resize and plot, the size rarely changes
+        max_size = (self.screen.width(), self.screen.height())
+        if max_size != self._lastMaxSize:
+            self._lastMaxSize = max_size
+            self.setMaximumSize(*max_size)
 
     def onRatioChange(self):
         av = self.model.activeView
         if av.aspectLock:
             ratio = av.width / max(av.height, .001)
-            av.v_res = int(av.h_res / ratio)
+            # keep the resolution within the range the dock box allows,
+            # the box no longer writes its clamped value back
+            vResBox = self.dock.vResBox
+            v_res = min(max(int(av.h_res / ratio), vResBox.minimum()),
+                        vResBox.maximum())
+            # most width/height edits leave the rounded resolution as is
+            if v_res == av.v_res:
+                return
+            av.v_res = v_res
             self.dock.updateVRes()
 
     def showCoords(self, xPlotPos, yPlotPos):
-        cv = self.model.currentView
-        if cv.basis == 'xy':
-            coords = ("({}, {}, {})".format(round(xPlotPos, 2),
-                                            round(yPlotPos, 2),
-                                            round(cv.origin[2], 2)))
-        elif cv.basis == 'xz':
-            coords = ("({}, {}, {})".format(round(xPlotPos, 2),
-                                            round(cv.origin[1], 2),
-                                            round(yPlotPos, 2)))
-        else:
-            coords = ("({}, {}, {})".format(round(cv.origin[0], 2),
-                                            round(xPlotPos, 2),
-                                            round(yPlotPos, 2)))
-        self.coord_label.setText('{}'.format(coords))
+        # the basis indices are kept up to date by updateRelativeBases
+        xyz = list(self.model.currentView.origin)
+        xyz[self.xBasis] = xPlotPos
+        xyz[self.yBasis] = yPlotPos
+        coords = "({:.2f}, {:.2f}, {:.2f})".format(*xyz)
+        # most pointer moves don't change the rounded coordinates
+        if coords != self._lastCoords:
+            self._lastCoords = coords
+            self.coord_label.setText(coords)
 
     def resizePixmap(self):
-        self.plotIm._resize()
-        self.plotIm.adjustSize()
+        if self.plotIm._resize():
+            self.plotIm.adjustSize()
 
     def moveEvent(self, event):
         self.adjustWindow()
@@ -1158,8 +1303,8 @@ class MainWindow(QMainWindow):
     def resizeEvent(self, event):
         self.plotIm._resize()
         self.adjustWindow()
-        self.updateScale()
-        if self.shortcutOverlay.isVisible():
+        if self.shortcutOverlay is not None and \
+           self.shortcutOverlay.isVisible():
             self.shortcutOverlay.resize(self.width(), self.height())
 
     def closeEvent(self, event):
@@ -1,3 +1,4 @@
+from functools import lru_cache
 
 import numpy as np
 
@@ -12,7 +13,13 @@ def random_rgb():
 
 
 def rgb_normalize(rgb):
-    return tuple([c/255. for c in rgb])
+    return _rgb_normalize(tuple(rgb))
+
+
+# the same few colors (e.g. the window background) are normalized repeatedly
+@lru_cache(maxsize=32)
+def _rgb_normalize(rgb):
+    return tuple(c/255. for c in rgb)
 
 
 def invert_rgb(rgb, normalized=False):
@@ -1,11 +1,13 @@
-from functools import partial
+import copy
+from functools import lru_cache, partial
 
 from PySide6 import QtCore, QtGui
 from PySide6.QtWidgets import (QWidget, QPushButton, QHBoxLayout, QVBoxLayout,
                                QFormLayout, QComboBox, QSpinBox,
                                QDoubleSpinBox, QSizePolicy, QMessageBox,
-                               QCheckBox, QRubberBand, QMenu, QDialog,
+                               QCheckBox, QMenu, QDialog,
                                QTabWidget, QTableView, QHeaderView)
+from PySide6.QtGui import QAction
 from matplotlib.figure import Figure
 from matplotlib import lines as mlines
 from matplotlib.colors import SymLogNorm
@@ -16,13 +18,69 @@ import numpy as np
 from .plot_colors import rgb_normalize, invert_rgb
 from .plotmodel import DomainDelegate, PlotModel
 from .plotmodel import _NOT_FOUND, _VOID_REGION, _OVERLAP, _MODEL_PROPERTIES
+from .plotmodel import NAME, _COLUMN_SAMPLE_TEXT
 from .scientific_spin_box import ScientificDoubleSpinBox
-from .custom_widgets import HorizontalLine
+from .custom_widgets import HorizontalLine, blocked_signals
 
 
+@lru_cache(maxsize=64)
+def _colorButtonStyle(r, g, b):
+    """ Style sheet of the color swatch buttons in the color dialog """
+    # channels may come as floats or numpy integers
+    r, g, b = int(r), int(g), int(b)
+    return "border-radius: 8px; background-color: #%06x" % (
+        (r << 16) | (g << 8) | b)
+
+
+@lru_cache(maxsize=16)
+def _parseContourLevels(line):
+    """ Parse the contour levels line, cached as it is re-read on redraws """
+    # if there are any commas in the line, treat as level values
+    line = line.strip()
+    if ',' in line:
+        return tuple(float(val) for val in line.split(",") if val != '')
+    else:
+        return int(line)
+
+
+class _GeneratePlotSignals(QtCore.QObject):
+    finished = QtCore.Signal()
+
+
+class GeneratePlotTask(QtCore.QRunnable):
+    """Generates the plot image of a model on a thread pool worker
+
+    Parameters
+    ----------
+    model : PlotModel
+        Model to generate the plot image for
+    view : PlotView
+        Copy of the active view to plot, taken on the GUI thread
+    """
+
+    def __init__(self, model, view):
+        super().__init__()
+        self.setAutoDelete(False)
+        self.model = model
+        self.view = view
+        self.result = None
+        self.signals = _GeneratePlotSignals()
+
+    def run(self):
+        try:
+            # the model is left untouched, the plot is made current on
+            # the GUI thread
+            self.result = self.model.computePlot(self.view)
+        finally:
+            self.signals.finished.emit()
+
 
 class PlotImage(FigureCanvas):
 
+    # emitted on the GUI thread once a plot generated on the thread pool
+    # has been handled
+    plotGenerated = QtCore.Signal()
+
     def __init__(self, model: PlotModel, parent, main_window):
 
         self.figure = Figure(dpi=main_window.logicalDpiX())
@@ -38,11 +96,20 @@ class PlotImage(FigureCanvas):
         self.parent = parent
 
         self.frozen = False
+        # (zoom, frame width, frame height) the canvas was last sized for
+        self._lastResizeKey = None
 
-        self.rubber_band = QRubberBand(QRubberBand.Rectangle, self)
+        # the zoom box is painted over the canvas in paintEvent, _bandShown
+        # holds the rectangle currently on screen (or None)
         self.band_origin = QtCore.QPoint()
+        self._rbRect = QtCore.QRect()
+        self._bandShown = None
         self.x_plot_origin = None
         self.y_plot_origin = None
+        # view values last forwarded to the main window during a drag
+        self._lastOriginSent = None
+        self._lastSizeSent = None
+        self._dragTarget = None
 
         self.colorbar = None
         self.data_indicator = None
@@ -50,16 +117,69 @@ class PlotImage(FigureCanvas):
         self.image = None
 
         self.menu = QMenu(self)
+        # domain specific menu actions, built on first use
+        self._domainIdAction = None
+
+        # pending background generation of the initial plot image
+        self._plotTask = None
+
+        # mouse moves are coalesced and handled at most once per timer
+        # interval, dropping the intermediate positions
+        self._pendingMove = None
+        self._moveTimer = QtCore.QTimer(self)
+        self._moveTimer.setSingleShot(True)
+        self._moveTimer.setInterval(16)
+        self._moveTimer.timeout.connect(self._processPendingMove)
+
+        # domain info of the last hovered pixel
+        self._lastIdKey = None
+        self._lastDomainInfo = ""
+
+        # axes bounds in display units and data limits of the axes,
+        # refreshed when the plot is redrawn or the canvas is resized
+        self._axPxBounds = None
+        self._dlim = None
+        self._pxScale = None
+        self.mpl_connect('resize_event', self._invalidateAxesGeometry)
+
+        # rendered figure without the (animated) data indicators, used to
+        # blit indicator updates instead of redrawing the whole figure
+        self._background = None
+        self.mpl_connect('draw_event', self._onDraw)
+        self.mpl_connect('resize_event', self._invalidateBackground)
+
+        # status bar messages are coalesced and shown at most ~30 times a
+        # second rather than repainting the status bar on every event
+        self._pendingStatus = ""
+        self._statusTimer = QtCore.QTimer(self)
+        self._statusTimer.setSingleShot(True)
+        self._statusTimer.setInterval(33)
+        self._statusTimer.timeout.connect(self._flushStatus)
+
+    def _showStatus(self, message):
+        self._pendingStatus = message
+        if not self._statusTimer.isActive():
+            self._statusTimer.start()
+
+    def _flushStatus(self):
+        status_bar = self.main_window.statusBar()
+        if status_bar.currentMessage() != self._pendingStatus:
+            status_bar.showMessage(self._pendingStatus)
 
     def enterEvent(self, event):
         self.setCursor(QtCore.Qt.CrossCursor)
         self.main_window.coord_label.show()
 
     def leaveEvent(self, event):
+        self._moveTimer.stop()
+        self._pendingMove = None
+        self._lastIdKey = None
         self.main_window.coord_label.hide()
-        self.main_window.statusBar().showMessage("")
+        self._showStatus("")
 
     def mousePressEvent(self, event):
+        if self._plotTask is not None:
+            return
         self.main_window.coord_label.hide()
         position = event.pos()
         # Set rubber band absolute and relative position
@@ -67,32 +187,102 @@ class PlotImage(FigureCanvas):
         self.x_plot_origin, self.y_plot_origin = self.getPlotCoords(position)
 
         # Create rubber band
-        self.rubber_band.setGeometry(QtCore.QRect(self.band_origin,
-                                                  QtCore.QSize()))
+        self._rbRect.setRect(position.x(), position.y(), 0, 0)
+        self._setBandVisible(False)
 
-    def getPlotCoords(self, pos):
+        self._lastOriginSent = None
+        self._lastSizeSent = None
+        self._dragTarget = None
+
+    def _invalidateAxesGeometry(self, event=None):
+        self._axPxBounds = None
+        self._dlim = None
+        self._pxScale = None
+
+    def _cacheAxesGeometry(self):
+        cv = self.model.currentView
+        bbox = self.ax.bbox
+        self._axPxBounds = (bbox.x0, bbox.y0, bbox.x1, bbox.y1)
+        # data origin and model units per display unit
+        dataLim = self.ax.dataLim
+        self._dlim = (dataLim.x0, dataLim.y0,
+                      dataLim.width / bbox.width,
+                      dataLim.height / bbox.height)
+        # image pixels per display unit
+        self._pxScale = (cv.h_res / bbox.width, cv.v_res / bbox.height)
+
+    def _resolveEvent(self, pos):
+        """Map a widget position to plot coordinates and image indices
+
+        Both conversions share the same display -> axes computation, so
+        mouse handlers needing plot coordinates and pixel indices only
+        walk the axes geometry once.
+
+        Parameters
+        ----------
+        pos : QtCore.QPoint
+            Position of the event in widget coordinates
+
+        Returns
+        -------
+        tuple
+            (xPlot, yPlot, xPix, yPix, insideAxes)
+        """
         x, y = self.mouseEventCoords(pos)
 
-        # get the normalized axis coordinates from the event display units
-        transform = self.ax.transAxes.inverted()
-        xPlotCoord, yPlotCoord = transform.transform((x, y))
-        # flip the y-axis (its zero is in the upper left)
+        if self._axPxBounds is None:
+            self._cacheAxesGeometry()
+
+        # axes box in display units
+        x0, y0, x1, y1 = self._axPxBounds
 
         # scale axes using the plot extents
-        xPlotCoord = self.ax.dataLim.x0 + xPlotCoord * self.ax.dataLim.width
-        yPlotCoord = self.ax.dataLim.y0 + yPlotCoord * self.ax.dataLim.height
+        dx0, dy0, xScale, yScale = self._dlim
+        xPlot = dx0 + (x - x0) * xScale
+        yPlot = dy0 + (y - y0) * yScale
+
+        # positions outside of the axes don't map to an image pixel; plot
+        # coordinates are still needed there to track rubber band drags
+        if not (x0 <= x <= x1 and y0 <= y <= y1):
+            return xPlot, yPlot, -1, -1, False
+
+        # use scale to get proper x,y position in pixels
+        xPxScale, yPxScale = self._pxScale
+        xPix = int((x - x0 + 0.01) * xPxScale)
+        # flip y-axis
+        yPix = self.model.currentView.v_res - int((y - y0 + 0.01) * yPxScale)
 
+        return xPlot, yPlot, xPix, yPix, True
+
+    def _updateCoordLabel(self, xPlotCoord, yPlotCoord, insideAxes):
         # set coordinate label if pointer is in the axes
-        if self.parent.underMouse():
+        if insideAxes and self.parent.underMouse():
             self.main_window.coord_label.show()
             self.main_window.showCoords(xPlotCoord, yPlotCoord)
         else:
             self.main_window.coord_label.hide()
 
+    def getPlotCoords(self, pos):
+        xPlotCoord, yPlotCoord, _, _, inside = self._resolveEvent(pos)
+        self._updateCoordLabel(xPlotCoord, yPlotCoord, inside)
         return (xPlotCoord, yPlotCoord)
 
     def _resize(self):
+        """ Size the canvas for the current zoom level
+
+        Returns
+        -------
+        bool
+            Whether the canvas geometry had to be updated
+        """
         z = self.main_window.zoom / 100.0
+        # the docks forward all of their move/resize events here, most of
+        # which leave the frame and zoom unchanged
+        key = (z, self.parent.width(), self.parent.height())
+        if key == self._lastResizeKey:
+            return False
+        self._lastResizeKey = key
+
         # manage scroll bars
         if z <= 1.0:
             self.parent.verticalScrollBar().hide()
@@ -110,6 +300,7 @@ class PlotImage(FigureCanvas):
         # resize plot
         self.resize(self.parent.width() * z,
                     self.parent.height() * z)
+        return True
 
     def saveImage(self, filename):
         """Save an image of the current view
@@ -121,35 +312,43 @@ class PlotImage(FigureCanvas):
         """
         if "." not in str(filename):
             filename += ".png"
-        self.figure.savefig(filename, transparent=True)
-
-    def getDataIndices(self, event):
-        cv = self.model.currentView
-
-        x, y = self.mouseEventCoords(event.pos())
-
-        # get origin in axes coordinates
-        x0, y0 = self.ax.transAxes.transform((0.0, 0.0))
-
-        # get the extents of the axes box in axes coordinates
-        bbox = self.ax.get_window_extent().transformed(
-            self.figure.dpi_scale_trans.inverted())
-        # get dimensions and scale using dpi
-        width, height = bbox.width, bbox.height
-        width *= self.figure.dpi
-        height *= self.figure.dpi
-
-        # use factor to get proper x,y position in pixels
-        factor = (width/cv.h_res, height/cv.v_res)
-        xPos = int((x - x0 + 0.01) / factor[0])
-        # flip y-axis
-        yPos = cv.v_res - int((y - y0 + 0.01) / factor[1])
-
-        return xPos, yPos
-
-    def getTallyIndices(self, event):
+        # animated artists are skipped when saving a figure
+        indicators = self._indicators()
+        for indicator in indicators:
+            indicator.set_animated(False)
+        try:
+            self.figure.savefig(filename, transparent=True)
+        finally:
+            for indicator in indicators:
+                indicator.set_animated(True)
+
+    def _indicators(self):
+        return [line for line in (self.data_indicator,
+                                  self.tally_data_indicator)
+                if line is not None]
+
+    def _invalidateBackground(self, event=None):
+        self._background = None
+
+    def _onDraw(self, event):
+        self._background = self.copy_from_bbox(self.figure.bbox)
+        self._drawIndicators()
+
+    def _drawIndicators(self):
+        for indicator in self._indicators():
+            if indicator.get_visible():
+                indicator.axes.draw_artist(indicator)
+
+    def _blitIndicators(self):
+        """Redraw the data indicators on top of the cached background"""
+        if self._background is None:
+            self.draw_idle()
+            return
+        self.restore_region(self._background)
+        self._drawIndicators()
+        self.blit(self.figure.bbox)
 
-        xPos, yPos = self.getPlotCoords(event.pos())
+    def getTallyIndices(self, xPos, yPos):
 
         ext = self.model.tally_extents
 
@@ -166,10 +365,10 @@ class PlotImage(FigureCanvas):
 
         return i, j
 
-    def getTallyInfo(self, event):
-        cv = self.model. currentView
+    def getTallyInfo(self, xPlotPos, yPlotPos):
+        cv = self.model.currentView
 
-        xPos, yPos = self.getTallyIndices(event)
+        xPos, yPos = self.getTallyIndices(xPlotPos, yPlotPos)
 
         if self.model.tally_data is None:
             return -1, None
@@ -183,40 +382,45 @@ class PlotImage(FigureCanvas):
         # check that the position is in the axes view
         v_res, h_res = self.model.tally_data.shape
         if 0 <= yPos < v_res and 0 <= xPos < h_res:
-            value = self.model.tally_data[yPos][xPos]
+            value = self.model.tally_data[yPos, xPos]
         else:
             value = None
 
         return cv.selectedTally, value
 
-    def getIDinfo(self, event):
+    def getIDinfo(self, xPos, yPos):
 
-        xPos, yPos = self.getDataIndices(event)
+        model = self.model
+        cv = model.currentView
+        av = model.activeView
 
         # check that the position is in the axes view
-        if 0 <= yPos < self.model.currentView.v_res \
-           and 0 <= xPos and xPos < self.model.currentView.h_res:
-            id = self.model.ids[yPos, xPos]
-            instance = self.model.instances[yPos, xPos]
-            temp = "{:g}".format(self.model.properties[yPos, xPos, 0])
-            density = "{:g}".format(self.model.properties[yPos, xPos, 1])
+        ids = model.ids
+        if 0 <= yPos < ids.shape[0] and 0 <= xPos < ids.shape[1]:
+            id = int(ids[yPos, xPos])
+            instance = int(model.instances[yPos, xPos])
+            # fetch both properties of the pixel in a single lookup
+            props = model.properties[yPos, xPos]
+            temp = "{:g}".format(props[0])
+            density = "{:g}".format(props[1])
         else:
             id = _NOT_FOUND
             instance = _NOT_FOUND
             density = str(_NOT_FOUND)
             temp = str(_NOT_FOUND)
 
-        if self.model.currentView.colorby == 'cell':
-            domain = self.model.activeView.cells
+        colorby = cv.colorby
+        if colorby == 'cell':
+            domain = av.cells
             domain_kind = 'Cell'
-        elif self.model.currentView.colorby == 'temperature':
-            domain = self.model.activeView.materials
+        elif colorby == 'temperature':
+            domain = av.materials
             domain_kind = 'Temperature'
-        elif self.model.currentView.colorby == 'density':
-            domain = self.model.activeView.materials
+        elif colorby == 'density':
+            domain = av.materials
             domain_kind = 'Density'
         else:
-            domain = self.model.activeView.materials
+            domain = av.materials
             domain_kind = 'Material'
 
         properties = {'density': density,
@@ -224,62 +428,100 @@ class PlotImage(FigureCanvas):
 
         return id, instance, properties, domain, domain_kind
 
+    def _formatDomainInfo(self, id, instance, properties, domain,
+                          domain_kind):
+        if domain_kind.lower() in _MODEL_PROPERTIES:
+            domain_kind = 'Material'
+
+        temperature = properties['temperature']
+        density = properties['density']
+
+        if instance != _NOT_FOUND and domain_kind == 'Cell':
+            instanceInfo = f" ({instance})"
+        else:
+            instanceInfo = ""
+        if id == _VOID_REGION:
+            domainInfo = ("VOID")
+        elif id == _OVERLAP:
+            domainInfo = ("OVERLAP")
+        elif id != _NOT_FOUND and domain[id].name:
+            domainInfo = ("{} {}{}: \"{}\"\t Density: {} g/cc\t"
+                          "Temperature: {} K".format(
+                              domain_kind,
+                              id,
+                              instanceInfo,
+                              domain[id].name,
+                              density,
+                              temperature
+                          ))
+        elif id != _NOT_FOUND:
+            domainInfo = ("{} {}{}\t Density: {} g/cc\t"
+                          "Temperature: {} K".format(domain_kind,
+                                                     id,
+                                                     instanceInfo,
+                                                     density,
+                                                     temperature))
+        else:
+            domainInfo = ""
+
+        return domainInfo
+
     def mouseDoubleClickEvent(self, event):
+        if self._plotTask is not None:
+            return
         xCenter, yCenter = self.getPlotCoords(event.pos())
         self.main_window.editPlotOrigin(xCenter, yCenter, apply=True)
 
     def mouseMoveEvent(self, event):
+        if self._plotTask is not None:
+            return
+        # only the latest position is handled once the timer fires
+        self._pendingMove = (event.pos(), event.buttons(), event.modifiers())
+        if not self._moveTimer.isActive():
+            self._moveTimer.start()
+
+    def _flushPendingMove(self):
+        if self._moveTimer.isActive():
+            self._moveTimer.stop()
+            self._processPendingMove()
+
+    def _processPendingMove(self):
+        if self._pendingMove is None:
+            return
+        pos, buttons, modifiers = self._pendingMove
+        self._pendingMove = None
+
         cv = self.model.currentView
+        xPlotPos, yPlotPos, xPix, yPix, inside = self._resolveEvent(pos)
+
         # Show Cursor position relative to plot in status bar
-        xPlotPos, yPlotPos = self.getPlotCoords(event.pos())
+        self._updateCoordLabel(xPlotPos, yPlotPos, inside)
 
         # Show Cell/Material ID, Name in status bar
-        id, instance, properties, domain, domain_kind = self.getIDinfo(event)
+        id, instance, properties, domain, domain_kind = \
+            self.getIDinfo(xPix, yPix)
 
         domainInfo = ""
         tallyInfo = ""
 
         if self.parent.underMouse():
 
-            if domain_kind.lower() in _MODEL_PROPERTIES:
-                line_val = float(properties[domain_kind.lower()])
-                line_val = max(line_val, 0.0)
-                self.updateDataIndicatorValue(line_val)
-                domain_kind = 'Material'
-
-            temperature = properties['temperature']
-            density = properties['density']
-
-            if instance != _NOT_FOUND and domain_kind == 'Cell':
-                instanceInfo = f" ({instance})"
-            else:
-                instanceInfo = ""
-            if id == _VOID_REGION:
-                domainInfo = ("VOID")
-            elif id == _OVERLAP:
-                domainInfo = ("OVERLAP")
-            elif id != _NOT_FOUND and domain[id].name:
-                domainInfo = ("{} {}{}: \"{}\"\t Density: {} g/cc\t"
-                              "Temperature: {} K".format(
-                                  domain_kind,
-                                  id,
-                                  instanceInfo,
-                                  domain[id].name,
-                                  density,
-                                  temperature
-                              ))
-            elif id != _NOT_FOUND:
-                domainInfo = ("{} {}{}\t Density: {} g/cc\t"
-                              "Temperature: {} K".format(domain_kind,
-                                                         id,
-                                                         instanceInfo,
-                                                         density,
-                                                         temperature))
-            else:
-                domainInfo = ""
+            # the domain info only changes when moving onto a pixel with
+            # different contents
+            key = (id, instance, properties['temperature'],
+                   properties['density'], domain_kind)
+            if key != self._lastIdKey:
+                self._lastIdKey = key
+                if domain_kind.lower() in _MODEL_PROPERTIES:
+                    line_val = float(properties[domain_kind.lower()])
+                    line_val = max(line_val, 0.0)
+                    self.updateDataIndicatorValue(line_val)
+                self._lastDomainInfo = self._formatDomainInfo(
+                    id, instance, properties, domain, domain_kind)
+            domainInfo = self._lastDomainInfo
 
             if self.model.tally_data is not None:
-                tid, value = self.getTallyInfo(event)
+                tid, value = self.getTallyInfo(xPlotPos, yPlotPos)
                 if value is not None and value != np.nan:
                     self.updateTallyDataIndicatorValue(value)
                     tallyInfo = "Tally {} {}: {:.5E}".format(
@@ -287,56 +529,107 @@ class PlotImage(FigureCanvas):
                 else:
                     self.updateTallyDataIndicatorValue(0.0)
         else:
+            self._lastIdKey = None
             self.updateTallyDataIndicatorValue(0.0)
             self.updateDataIndicatorValue(0.0)
 
         if domainInfo:
-            self.main_window.statusBar().showMessage(
-                " " + domainInfo + "      " + tallyInfo)
+            self._showStatus(" " + domainInfo + "      " + tallyInfo)
         else:
-            self.main_window.statusBar().showMessage(" " + tallyInfo)
+            self._showStatus(" " + tallyInfo)
 
         # Update rubber band and values if mouse button held down
-        if event.buttons() == QtCore.Qt.LeftButton:
-            self.rubber_band.setGeometry(
-                QtCore.QRect(self.band_origin, event.pos()).normalized())
+        if buttons == QtCore.Qt.LeftButton:
+            x0, y0 = self.band_origin.x(), self.band_origin.y()
+            x1, y1 = pos.x(), pos.y()
+            self._rbRect.setCoords(min(x0, x1), min(y0, y1),
+                                   max(x0, x1), max(y0, y1))
 
             # Show rubber band if both dimensions > 10 pixels
-            if self.rubber_band.width() > 10 and self.rubber_band.height() > 10:
-                self.rubber_band.show()
-            else:
-                self.rubber_band.hide()
+            self._setBandVisible(self._rbRect.width() > 10 and
+                                 self._rbRect.height() > 10)
+
+            # changes smaller than an image pixel aren't forwarded to the
+            # dock while dragging
+            dx = cv.width / cv.h_res
+            dy = cv.height / cv.v_res
 
             # Update plot X Origin
             xCenter = (self.x_plot_origin + xPlotPos) / 2
             yCenter = (self.y_plot_origin + yPlotPos) / 2
-            self.main_window.editPlotOrigin(xCenter, yCenter)
-
-            modifiers = event.modifiers()
+            last = self._lastOriginSent
+            if last is None or abs(xCenter - last[0]) >= dx or \
+               abs(yCenter - last[1]) >= dy:
+                self.main_window.editPlotOrigin(xCenter, yCenter)
+                self._lastOriginSent = (xCenter, yCenter)
 
             # Zoom out if Shift held
             if modifiers == QtCore.Qt.ShiftModifier:
-                cv = self.model.currentView
-                bandwidth = abs(self.band_origin.x() - event.pos().x())
+                bandwidth = abs(self.band_origin.x() - pos.x())
                 width = cv.width * (cv.h_res / max(bandwidth, .001))
-                bandheight = abs(self.band_origin.y() - event.pos().y())
+                bandheight = abs(self.band_origin.y() - pos.y())
                 height = cv.height * (cv.v_res / max(bandheight, .001))
             # Zoom in
             else:
                 width = max(abs(self.x_plot_origin - xPlotPos), 0.1)
                 height = max(abs(self.y_plot_origin - yPlotPos), 0.1)
 
-            self.main_window.editWidth(width)
-            self.main_window.editHeight(height)
+            last = self._lastSizeSent
+            if last is None or abs(width - last[0]) >= dx or \
+               abs(height - last[1]) >= dy:
+                self.main_window.editWidth(width)
+                self.main_window.editHeight(height)
+                self._lastSizeSent = (width, height)
+
+            self._dragTarget = (xCenter, yCenter, width, height)
 
     def mouseReleaseEvent(self, event):
+        if self._plotTask is not None:
+            return
 
-        if self.rubber_band.isVisible():
-            self.rubber_band.hide()
+        # make sure the final drag position has been applied
+        self._flushPendingMove()
+
+        if self._bandShown is not None:
+            self._setBandVisible(False)
+            # send the exact final values, which may have been below the
+            # drag threshold
+            if self._dragTarget is not None:
+                xCenter, yCenter, width, height = self._dragTarget
+                self.main_window.editPlotOrigin(xCenter, yCenter)
+                self.main_window.editWidth(width)
+                self.main_window.editHeight(height)
             self.main_window.applyChanges()
         else:
             self.main_window.revertDockControls()
 
+    def _setBandVisible(self, visible):
+        """ Show the zoom box at _rbRect or hide it
+
+        Only the area covered by the old and new boxes is repainted.
+        """
+        old = self._bandShown
+        if visible and old == self._rbRect:
+            return
+        self._bandShown = QtCore.QRect(self._rbRect) if visible else None
+        if old is None and self._bandShown is None:
+            return
+        dirty = old if self._bandShown is None else self._bandShown
+        if old is not None:
+            dirty = dirty.united(old)
+        self.update(dirty.adjusted(-1, -1, 1, 1))
+
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if self._bandShown is None:
+            return
+        painter = QtGui.QPainter(self)
+        pen = QtGui.QPen(self.palette().color(QtGui.QPalette.Highlight))
+        pen.setStyle(QtCore.Qt.DashLine)
+        painter.setPen(pen)
+        painter.drawRect(self._bandShown)
+        painter.end()
+
     def wheelEvent(self, event):
 
         if event.angleDelta() and event.modifiers() == QtCore.Qt.ShiftModifier:
@@ -345,116 +638,163 @@ class PlotImage(FigureCanvas):
             if 24 < self.main_window.zoom + numDegrees < 5001:
                 self.main_window.editZoom(self.main_window.zoom + numDegrees)
 
+    def _buildMenu(self):
+        """Create the context menu and the actions that depend on the
+        clicked domain
+
+        The menu is built once and re-targeted by contextMenuEvent.
+        """
+        self._menuDomain = (None, None)
+
+        self._domainIdAction = QAction(self)
+        self._domainIdAction.triggered.connect(self._viewMenuDomainProps)
+
+        self._colorAction = QAction(self)
+        self._colorAction.triggered.connect(self._editMenuDomainColor)
+
+        self._maskAction = QAction(self)
+        self._maskAction.setCheckable(True)
+        self._maskAction.triggered.connect(self._toggleMenuDomainMask)
+
+        self._highlightAction = QAction(self)
+        self._highlightAction.setCheckable(True)
+        self._highlightAction.triggered.connect(
+            self._toggleMenuDomainHighlight)
+
+        self._bgColorAction = QAction('Edit Background Color...', self)
+        self._bgColorAction.setToolTip('Edit background color')
+        self._bgColorAction.setStatusTip('Edit plot background color')
+        self._bgColorAction.triggered.connect(
+            partial(self.main_window.editBackgroundColor, apply=True))
+
+        self._overlapColorAction = QAction('Edit Overlap Color...', self)
+        self._overlapColorAction.setToolTip('Edit overlap color')
+        self._overlapColorAction.setStatusTip('Edit plot overlap color')
+        self._overlapColorAction.triggered.connect(
+            partial(self.main_window.editOverlapColor, apply=True))
+
+        # lay out the whole menu once, contextMenuEvent only toggles the
+        # visibility of the domain dependent entries
+        mw = self.main_window
+        self.menu.addAction(mw.undoAction)
+        self.menu.addAction(mw.redoAction)
+        self._domainSep = self.menu.addSeparator()
+        self.menu.addAction(self._domainIdAction)
+        self._domainIdSep = self.menu.addSeparator()
+        self.menu.addAction(self._colorAction)
+        self.menu.addAction(self._maskAction)
+        self.menu.addAction(self._highlightAction)
+        self.menu.addAction(self._bgColorAction)
+        self.menu.addAction(self._overlapColorAction)
+        self.menu.addSeparator()
+        self.menu.addAction(mw.saveImageAction)
+        self.menu.addAction(mw.saveViewAction)
+        self.menu.addAction(mw.openAction)
+        self.menu.addSeparator()
+        self.menu.addMenu(mw.basisMenu)
+        self.menu.addMenu(mw.colorbyMenu)
+        self.menu.addSeparator()
+        # the view toggles are shared with the main menu bar, so they are
+        # inserted/removed here rather than hidden
+        self._viewToggleActions = [mw.maskingAction, mw.highlightingAct,
+                                   mw.overlapAct]
+        self.menu.addActions(self._viewToggleActions)
+        self._viewTogglesShown = True
+        self._dockSep = self.menu.addSeparator()
+        self.menu.addAction(mw.dockAction)
+
+    def _viewMenuDomainProps(self):
+        domain_kind, id = self._menuDomain
+        # add connector to a new window of info here for material props
+        if domain_kind == 'Material':
+            self.main_window.viewMaterialProps(id)
+
+    def _editMenuDomainColor(self):
+        domain_kind, id = self._menuDomain
+        self.main_window.editDomainColor(domain_kind, id)
+
+    def _toggleMenuDomainMask(self, state):
+        domain_kind, id = self._menuDomain
+        self.main_window.toggleDomainMask(state, domain_kind, id)
+
+    def _toggleMenuDomainHighlight(self, state):
+        domain_kind, id = self._menuDomain
+        self.main_window.toggleDomainHighlight(state, domain_kind, id)
+
     def contextMenuEvent(self, event):
+        if self._plotTask is not None:
+            return
 
-        self.menu.clear()
+        if self._domainIdAction is None:
+            self._buildMenu()
+
+        model = self.model
+        cv = model.currentView
 
         self.main_window.undoAction.setText(
-            '&Undo ({})'.format(len(self.model.previousViews)))
+            '&Undo ({})'.format(len(model.previousViews)))
         self.main_window.redoAction.setText(
-            '&Redo ({})'.format(len(self.model.subsequentViews)))
+            '&Redo ({})'.format(len(model.subsequentViews)))
 
-        id, instance, properties, domain, domain_kind = self.getIDinfo(event)
+        _, _, xPix, yPix, _ = self._resolveEvent(event.pos())
+        id, instance, properties, domain, domain_kind = \
+            self.getIDinfo(xPix, yPix)
 
-        cv = self.model.currentView
-
-        # always provide undo option
-        self.menu.addSeparator()
-        self.menu.addAction(self.main_window.undoAction)
-        self.menu.addAction(self.main_window.redoAction)
-        self.menu.addSeparator()
+        domain_colors = cv.colorby not in _MODEL_PROPERTIES
+        show_domain = id not in (_NOT_FOUND, _OVERLAP) and domain_colors
 
-        if int(id) not in (_NOT_FOUND, _OVERLAP) and \
-           cv.colorby not in _MODEL_PROPERTIES:
+        if show_domain:
+            self._menuDomain = (domain_kind, id)
+            dom = domain[id]
 
             # Domain ID
-            if domain[id].name:
-                domainID = self.menu.addAction(
-                    "{} {} Info: \"{}\"".format(domain_kind, id, domain[id].name))
+            if dom.name:
+                self._domainIdAction.setText(
+                    "{} {} Info: \"{}\"".format(domain_kind, id, dom.name))
             else:
-                domainID = self.menu.addAction(
+                self._domainIdAction.setText(
                     "{} {} Info".format(domain_kind, id))
 
-            # add connector to a new window of info here for material props
-            if domain_kind == 'Material':
-                mat_prop_connector = partial(
-                    self.main_window.viewMaterialProps, id)
-                domainID.triggered.connect(mat_prop_connector)
-
-            self.menu.addSeparator()
-
-            colorAction = self.menu.addAction(
-                'Edit {} Color...'.format(domain_kind))
-            colorAction.setDisabled(cv.highlighting)
-            colorAction.setToolTip('Edit {} color'.format(domain_kind))
-            colorAction.setStatusTip('Edit {} color'.format(domain_kind))
-            domain_color_connector = partial(self.main_window.editDomainColor,
-                                             domain_kind,
-                                             id)
-            colorAction.triggered.connect(domain_color_connector)
-
-            maskAction = self.menu.addAction('Mask {}'.format(domain_kind))
-            maskAction.setCheckable(True)
-            maskAction.setChecked(domain[id].masked)
-            maskAction.setDisabled(not cv.masking)
-            maskAction.setToolTip('Toggle {} mask'.format(domain_kind))
-            maskAction.setStatusTip('Toggle {} mask'.format(domain_kind))
-            mask_connector = partial(self.main_window.toggleDomainMask,
-                                     kind=domain_kind,
-                                     id=id)
-            maskAction.toggled.connect(mask_connector)
-
-            highlightAction = self.menu.addAction(
-                'Highlight {}'.format(domain_kind))
-            highlightAction.setCheckable(True)
-            highlightAction.setChecked(domain[id].highlight)
-            highlightAction.setDisabled(not cv.highlighting)
-            highlightAction.setToolTip(
+            self._colorAction.setText('Edit {} Color...'.format(domain_kind))
+            self._colorAction.setDisabled(cv.highlighting)
+            self._colorAction.setToolTip('Edit {} color'.format(domain_kind))
+            self._colorAction.setStatusTip('Edit {} color'.format(domain_kind))
+
+            self._maskAction.setText('Mask {}'.format(domain_kind))
+            self._maskAction.setChecked(dom.masked)
+            self._maskAction.setDisabled(not cv.masking)
+            self._maskAction.setToolTip('Toggle {} mask'.format(domain_kind))
+            self._maskAction.setStatusTip(
+                'Toggle {} mask'.format(domain_kind))
+
+            self._highlightAction.setText('Highlight {}'.format(domain_kind))
+            self._highlightAction.setChecked(dom.highlight)
+            self._highlightAction.setDisabled(not cv.highlighting)
+            self._highlightAction.setToolTip(
                 'Toggle {} highlight'.format(domain_kind))
-            highlightAction.setStatusTip(
+            self._highlightAction.setStatusTip(
                 'Toggle {} highlight'.format(domain_kind))
-            highlight_connector = partial(self.main_window.toggleDomainHighlight,
-                                          kind=domain_kind,
-                                          id=id)
-            highlightAction.toggled.connect(highlight_connector)
 
-        else:
-            self.menu.addAction(self.main_window.undoAction)
-            self.menu.addAction(self.main_window.redoAction)
-
-            if cv.colorby not in _MODEL_PROPERTIES:
-                self.menu.addSeparator()
-                if int(id) == _NOT_FOUND:
-                    bgColorAction = self.menu.addAction(
-                        'Edit Background Color...')
-                    bgColorAction.setToolTip('Edit background color')
-                    bgColorAction.setStatusTip('Edit plot background color')
-                    connector = partial(self.main_window.editBackgroundColor,
-                                        apply=True)
-                    bgColorAction.triggered.connect(connector)
-                elif int(id) == _OVERLAP:
-                    olapColorAction = self.menu.addAction(
-                        'Edit Overlap Color...')
-                    olapColorAction.setToolTip('Edit overlap color')
-                    olapColorAction.setStatusTip('Edit plot overlap color')
-                    connector = partial(self.main_window.editOverlapColor,
-                                        apply=True)
-                    olapColorAction.triggered.connect(connector)
-
-        self.menu.addSeparator()
-        self.menu.addAction(self.main_window.saveImageAction)
-        self.menu.addAction(self.main_window.saveViewAction)
-        self.menu.addAction(self.main_window.openAction)
-        self.menu.addSeparator()
-        self.menu.addMenu(self.main_window.basisMenu)
-        self.menu.addMenu(self.main_window.colorbyMenu)
-        self.menu.addSeparator()
-        if domain_kind.lower() not in ('density', 'temperature'):
-            self.menu.addAction(self.main_window.maskingAction)
-            self.menu.addAction(self.main_window.highlightingAct)
-            self.menu.addAction(self.main_window.overlapAct)
-            self.menu.addSeparator()
-        self.menu.addAction(self.main_window.dockAction)
+        for action in (self._domainIdAction, self._domainIdSep,
+                       self._colorAction, self._maskAction,
+                       self._highlightAction):
+            action.setVisible(show_domain)
+        self._domainSep.setVisible(domain_colors)
+        self._bgColorAction.setVisible(
+            not show_domain and domain_colors and id == _NOT_FOUND)
+        self._overlapColorAction.setVisible(
+            not show_domain and domain_colors and id == _OVERLAP)
+
+        show_toggles = domain_kind.lower() not in ('density', 'temperature')
+        if show_toggles != self._viewTogglesShown:
+            if show_toggles:
+                self.menu.insertActions(self._dockSep,
+                                        self._viewToggleActions)
+            else:
+                for action in self._viewToggleActions:
+                    self.menu.removeAction(action)
+            self._dockSep.setVisible(show_toggles)
+            self._viewTogglesShown = show_toggles
 
         self.main_window.maskingAction.setChecked(cv.masking)
         self.main_window.highlightingAct.setChecked(cv.highlighting)
@@ -475,10 +815,72 @@ class PlotImage(FigureCanvas):
         if update:
             self.updatePixmap()
 
+    def generatePixmapAsync(self, callback):
+        """Generate the plot image on the thread pool
+
+        Parameters
+        ----------
+        callback : callable
+            Called on the GUI thread once the image has been generated.
+            Called right away if the canvas is frozen.
+        """
+        if self.frozen:
+            callback()
+            return
+        self._generatePlotAsync(callback)
+
+    def isGenerating(self):
+        return self._plotTask is not None
+
+    def waitForPlot(self):
+        """Process events until the pending plot generation has finished"""
+        if self._plotTask is None:
+            return
+        # plotGenerated is emitted from _onPlotGenerated, which only runs
+        # while events are processed, so it can't fire before exec(). The
+        # completion callback may queue another plot, wait for that too.
+        loop = QtCore.QEventLoop()
+        self.plotGenerated.connect(loop.quit)
+        try:
+            while self._plotTask is not None:
+                loop.exec()
+        finally:
+            self.plotGenerated.disconnect(loop.quit)
+
+    def _generatePlotAsync(self, callback=None):
+        if self._plotTask is not None:
+            return
+        # the active view stays editable while the plot is generated, the
+        # worker gets a copy of its current state
+        view = copy.deepcopy(self.model.activeView)
+        self._plotTask = GeneratePlotTask(self.model, view)
+        self._plotTask.signals.finished.connect(
+            partial(self._onPlotGenerated, callback))
+        QtCore.QThreadPool.globalInstance().start(self._plotTask)
+
+    def _onPlotGenerated(self, callback=None):
+        task, self._plotTask = self._plotTask, None
+        try:
+            if task.result is not None:
+                self.model.publishPlot(task.result)
+            if callback is not None:
+                callback()
+            # don't loop on a failed generation
+            elif hasattr(self.model, 'image'):
+                self.updatePixmap()
+        finally:
+            self.plotGenerated.emit()
+
     def updatePixmap(self):
 
         # clear out figure
         self.figure.clear()
+        # the colorbars and indicators went with the old axes
+        self.colorbar = None
+        self.data_indicator = None
+        self.tally_data_indicator = None
+        self._background = None
+        self._lastIdKey = None
 
         cv = self.model.currentView
         # set figure bg color to match window
@@ -492,9 +894,16 @@ class PlotImage(FigureCanvas):
                        cv.origin[self.main_window.yBasis] - cv.height/2.,
                        cv.origin[self.main_window.yBasis] + cv.height/2.]
 
-        # make sure we have a domain image to load
+        # make sure we have a domain image to load, generating it in the
+        # background and showing a placeholder in the meantime
         if not hasattr(self.model, 'image'):
-            self.model.generatePlot()
+            self._generatePlotAsync()
+            self.ax = self.figure.subplots()
+            self.ax.imshow(np.full((1, 1, 3), 0.5), extent=data_bounds)
+            self.ax.set_title('Generating plot...')
+            self._invalidateAxesGeometry()
+            self.draw_idle()
+            return
 
         ### DRAW DOMAIN IMAGE ###
 
@@ -537,7 +946,8 @@ class PlotImage(FigureCanvas):
                                                 [0.0, 0.0],
                                                 linewidth=3.,
                                                 color='blue',
-                                                clip_on=True)
+                                                clip_on=True,
+                                                animated=True)
             self.colorbar.ax.add_line(self.data_indicator)
             self.colorbar.ax.margins(0.0, 0.0)
             self.updateDataIndicatorVisibility()
@@ -620,7 +1030,8 @@ class PlotImage(FigureCanvas):
                                                       [0.0, 0.0],
                                                       linewidth=3.,
                                                       color='blue',
-                                                      clip_on=True)
+                                                      clip_on=True,
+                                                      animated=True)
             self.tally_colorbar.ax.add_line(self.tally_data_indicator)
             self.tally_colorbar.ax.margins(0.0, 0.0)
 
@@ -644,7 +1055,8 @@ class PlotImage(FigureCanvas):
         self.ax.dataLim.y0 = data_bounds[2]
         self.ax.dataLim.y1 = data_bounds[3]
 
-        self.draw()
+        self._invalidateAxesGeometry()
+        self.draw_idle()
         return "Done"
 
     def add_outlines(self):
@@ -666,12 +1078,8 @@ class PlotImage(FigureCanvas):
 
     @staticmethod
     def parseContoursLine(line):
-        # if there are any commas in the line, treat as level values
-        line = line.strip()
-        if ',' in line:
-            return [float(val) for val in line.split(",") if val != '']
-        else:
-            return int(line)
+        levels = _parseContourLevels(line)
+        return list(levels) if isinstance(levels, tuple) else levels
 
     def updateColorbarScale(self):
         self.updatePixmap()
@@ -690,7 +1098,7 @@ class PlotImage(FigureCanvas):
             self.tally_data_indicator.set_data([data[0], [y_val, y_val]])
             dl_color = invert_rgb(self.tally_image.get_cmap()(y_val), True)
             self.tally_data_indicator.set_c(dl_color)
-            self.draw()
+            self._blitIndicators()
 
     def updateDataIndicatorValue(self, y_val):
         cv = self.model.currentView
@@ -707,30 +1115,35 @@ class PlotImage(FigureCanvas):
             self.data_indicator.set_data([data[0], [y_val, y_val]])
             dl_color = invert_rgb(self.image.get_cmap()(y_val), True)
             self.data_indicator.set_c(dl_color)
-            self.draw()
+            self._blitIndicators()
 
     def updateDataIndicatorVisibility(self):
         cv = self.model.currentView
         if self.data_indicator and cv.colorby in _MODEL_PROPERTIES:
             val = cv.data_indicator_enabled[cv.colorby]
             self.data_indicator.set_visible(val)
-            self.draw()
+            self._blitIndicators()
 
     def updateColorMap(self, colormap_name, property_type):
         if self.colorbar and property_type == self.model.activeView.colorby:
+            # the colorbar only needs to be redrawn for a new colormap
+            if self.image.get_cmap().name == colormap_name:
+                return
             self.image.set_cmap(colormap_name)
-            self.colorbar.draw_all()
-            self.draw()
+            self.colorbar.update_normal(self.image)
+            self.draw_idle()
 
     def updateColorMinMax(self, property_type):
         av = self.model.activeView
         if self.colorbar and property_type == av.colorby:
             clim = av.getColorLimits(property_type)
+            changed = tuple(self.colorbar.mappable.get_clim()) != tuple(clim[:2])
             self.colorbar.mappable.set_clim(*clim)
             self.data_indicator.set_data(clim[:2],
                                          (0.0, 0.0))
-            self.colorbar.draw_all()
-            self.draw()
+            if changed:
+                self.colorbar.update_normal(self.image)
+                self.draw_idle()
 
 
 class ColorDialog(QDialog):
@@ -744,6 +1157,17 @@ class ColorDialog(QDialog):
         self.font_metric = font_metric
         self.main_window = parent
 
+        # last colors applied to the color buttons
+        self._lastMaskCol = None
+        self._lastHlCol = None
+        self._lastBgCol = None
+        self._lastOverlapCol = None
+        # last masking/highlighting state applied to the domain tables
+        self._lastMasking = None
+        self._lastHighlighting = None
+        # set when the view changed while the dialog was hidden
+        self._valuesStale = False
+
         self.createDialogLayout()
 
     def createDialogLayout(self):
@@ -884,9 +1308,21 @@ class ColorDialog(QDialog):
         domainTable.setModel(domainmodel)
         domainTable.setItemDelegate(DomainDelegate(domainTable))
         domainTable.verticalHeader().setVisible(False)
-        domainTable.resizeColumnsToContents()
         domainTable.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
-        domainTable.horizontalHeader().setSectionResizeMode(1, QHeaderView.Stretch)
+
+        # the delegate sizes the columns from sample text rather than their
+        # contents, so set the widths directly instead of visiting every row
+        header = domainTable.horizontalHeader()
+        for column in range(domainmodel.columnCount()):
+            if column == NAME:
+                continue
+            width = header.sectionSizeHint(column)
+            if column in _COLUMN_SAMPLE_TEXT:
+                text_width = self.font_metric.boundingRect(
+                    _COLUMN_SAMPLE_TEXT[column]).width()
+                width = max(width, text_width)
+            domainTable.setColumnWidth(column, width)
+        header.setSectionResizeMode(NAME, QHeaderView.Stretch)
 
         return domainTable
 
@@ -1012,24 +1448,46 @@ class ColorDialog(QDialog):
         self.buttonBox = QWidget()
         self.buttonBox.setLayout(buttonLayout)
 
-    def updateDialogValues(self):
+    def showEvent(self, event):
+        if self._valuesStale:
+            self.updateDialogValues()
+        super().showEvent(event)
 
-        self.updateMasking()
-        self.updateMaskingColor()
-        self.updateColorMaps()
-        self.updateColorMinMax()
-        self.updateColorbarScale()
-        self.updateDataIndicatorVisibility()
-        self.updateHighlighting()
-        self.updateHighlightColor()
-        self.updateAlpha()
-        self.updateSeed()
-        self.updateBackgroundColor()
-        self.updateColorBy()
-        self.updateUniverseLevel()
-        self.updateDomainTabs()
-        self.updateOverlap()
-        self.updateOverlapColor()
+    def updateDialogValues(self):
+        # the dialog is usually closed, refresh it once it's shown instead
+        # of on every apply
+        if not self.isVisible():
+            self._valuesStale = True
+            return
+        self._valuesStale = False
+
+        # the model already holds these values, don't echo them back
+        widgets = [self.maskingCheck, self.hlCheck, self.alphaBox,
+                   self.seedBox, self.colorbyBox, self.universeLevelBox,
+                   self.overlapCheck]
+        for key in _MODEL_PROPERTIES:
+            tab = self.tabs[key]
+            widgets += [tab.minMaxCheckBox, tab.minBox, tab.maxBox,
+                        tab.colormapBox, tab.dataIndicatorCheckBox,
+                        tab.colorBarScaleCheckBox]
+
+        with blocked_signals(*widgets):
+            self.updateMasking()
+            self.updateMaskingColor()
+            self.updateColorMaps()
+            self.updateColorMinMax()
+            self.updateColorbarScale()
+            self.updateDataIndicatorVisibility()
+            self.updateHighlighting()
+            self.updateHighlightColor()
+            self.updateAlpha()
+            self.updateSeed()
+            self.updateBackgroundColor()
+            self.updateColorBy()
+            self.updateUniverseLevel()
+            self.updateDomainTabs()
+            self.updateOverlap()
+            self.updateOverlapColor()
 
     def updateMasking(self):
         masking = self.model.activeView.masking
@@ -1037,6 +1495,11 @@ class ColorDialog(QDialog):
         self.maskingCheck.setChecked(masking)
         self.maskColorButton.setDisabled(not masking)
 
+        # the table columns only need updating when the state changes
+        if masking == self._lastMasking:
+            return
+        self._lastMasking = masking
+
         if masking:
             self.cellTable.showColumn(4)
             self.matTable.showColumn(4)
@@ -1046,8 +1509,11 @@ class ColorDialog(QDialog):
 
     def updateMaskingColor(self):
         color = self.model.activeView.maskBackground
-        style_values = "border-radius: 8px; background-color: rgb{}"
-        self.maskColorButton.setStyleSheet(style_values.format(str(color)))
+        # avoid re-polishing the button when the color hasn't changed
+        if color == self._lastMaskCol:
+            return
+        self._lastMaskCol = color
+        self.maskColorButton.setStyleSheet(_colorButtonStyle(*color[:3]))
 
     def updateHighlighting(self):
         highlighting = self.model.activeView.highlighting
@@ -1057,6 +1523,10 @@ class ColorDialog(QDialog):
         self.alphaBox.setDisabled(not highlighting)
         self.seedBox.setDisabled(not highlighting)
 
+        if highlighting == self._lastHighlighting:
+            return
+        self._lastHighlighting = highlighting
+
         if highlighting:
             self.cellTable.showColumn(5)
             self.cellTable.hideColumn(2)
@@ -1074,8 +1544,10 @@ class ColorDialog(QDialog):
 
     def updateHighlightColor(self):
         color = self.model.activeView.highlightBackground
-        style_values = "border-radius: 8px; background-color: rgb{}"
-        self.hlColorButton.setStyleSheet(style_values.format(str(color)))
+        if color == self._lastHlCol:
+            return
+        self._lastHlCol = color
+        self.hlColorButton.setStyleSheet(_colorButtonStyle(*color[:3]))
 
     def updateAlpha(self):
         self.alphaBox.setValue(self.model.activeView.highlightAlpha)
@@ -1085,13 +1557,17 @@ class ColorDialog(QDialog):
 
     def updateBackgroundColor(self):
         color = self.model.activeView.domainBackground
-        self.bgButton.setStyleSheet("border-radius: 8px;"
-                                    "background-color: rgb%s" % (str(color)))
+        if color == self._lastBgCol:
+            return
+        self._lastBgCol = color
+        self.bgButton.setStyleSheet(_colorButtonStyle(*color[:3]))
 
     def updateOverlapColor(self):
         color = self.model.activeView.overlap_color
-        self.overlapColorButton.setStyleSheet("border-radius: 8px;"
-                                              "background-color: rgb%s" % (str(color)))
+        if color == self._lastOverlapCol:
+            return
+        self._lastOverlapCol = color
+        self.overlapColorButton.setStyleSheet(_colorButtonStyle(*color[:3]))
 
     def updateOverlap(self):
         colorby = self.model.activeView.colorby
@@ -1113,5 +1589,11 @@ class ColorDialog(QDialog):
             self.universeLevelBox.setCurrentText(str(level))
 
     def updateDomainTabs(self):
-        self.cellTable.setModel(self.main_window.cellsModel)
-        self.matTable.setModel(self.main_window.materialsModel)
+        for table, model in ((self.cellTable, self.main_window.cellsModel),
+                             (self.matTable, self.main_window.materialsModel)):
+            if table.model() is model:
+                continue
+            table.setModel(model)
+            # a new model resets the hidden state of the table columns
+            self._lastMasking = None
+            self._lastHighlighting = None
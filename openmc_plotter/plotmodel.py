@@ -1,7 +1,8 @@
 from __future__ import annotations
 from ast import literal_eval
-from collections import defaultdict
+from collections import defaultdict, namedtuple, OrderedDict
 import copy
+from functools import lru_cache
 import hashlib
 import itertools
 import pickle
@@ -21,11 +22,22 @@ from .plot_colors import random_rgb, reset_seed
 
 ID, NAME, COLOR, COLORLABEL, MASK, HIGHLIGHT = range(6)
 
+# text used to size the fixed-width domain table columns
+_COLUMN_SAMPLE_TEXT = {ID: "XXXXXX",
+                       COLOR: "XXXXXX",
+                       COLORLABEL: "X(XXX, XXX, XXX)X",
+                       MASK: "XXXX"}
+
 _VOID_REGION = -1
 _NOT_FOUND = -2
 _OVERLAP = -3
 
 _MODEL_PROPERTIES = ('temperature', 'density')
+
+# maximum number of views kept for undo
+_MAX_UNDO_VIEWS = 50
+# number of id/property maps kept for recently plotted views
+_MAP_CACHE_SIZE = 4
 _PROPERTY_INDICES = {'temperature': 0, 'density': 1}
 
 _REACTION_UNITS = 'reactions/source'
@@ -74,6 +86,11 @@ _TALLY_VALUES = {'Mean': 'mean',
 
 TallyValueType = Literal['mean', 'std_dev', 'rel_err']
 
+# plot computed by PlotModel.computePlot, made current by publishPlot
+PlotResult = namedtuple('PlotResult', ['view', 'ids_map', 'properties',
+                                       'maps_generation', 'ids',
+                                       'ids_cache', 'image', 'minmax'])
+
 
 def hash_file(path):
     # return the md5 hash of a file
@@ -101,6 +118,14 @@ def hash_model(model_path):
     return mat_xml_hash, geom_xml_hash
 
 
+@lru_cache(maxsize=1024)
+def _domainColor(color):
+    """ Swatch color of a domain, shared by all rows with the same color """
+    if isinstance(color, str):
+        color = openmc.plots._SVG_COLORS[color]
+    return QColor.fromRgb(*color)
+
+
 class PlotModel:
     """Geometry and plot settings for OpenMC Plot Explorer model
 
@@ -133,7 +158,8 @@ class PlotModel:
         IDs of the applied filters for the displayed tally
     previousViews : list of PlotView instances
         List of previously created plot view settings used to undo
-        changes made in plot explorer
+        changes made in plot explorer, holding at most _MAX_UNDO_VIEWS
+        entries
     subsequentViews : list of PlotView instances
         List of undone plot view settings used to redo changes made
         in plot explorer
@@ -160,6 +186,23 @@ class PlotModel:
         # Return values from id_map and property_map
         self.ids_map = None
         self.properties = None
+        # (id_map, property_map) of recent views keyed by their view
+        # parameters, so undo/redo doesn't have to rerun openmc.lib
+        self._mapCache = OrderedDict()
+        # bumped whenever the cached maps no longer match openmc.lib, the
+        # maps on display are refetched unless they are of the same one
+        self._mapsGeneration = 0
+        self._plotMapsGeneration = 0
+
+        # serializes plot generation, which may run on a worker thread
+        self._plotLock = threading.Lock()
+        # image buffers reused by makePlot, used in turn since the canvas
+        # may still show the previous image while a new one is generated
+        self._imageBuffers = [None, None]
+        self._imageBufferIndex = 0
+        # (ids_map, colorby, ids, unique ids, inverse) of the plot on
+        # display, reused when only the domain colors or settings change
+        self._idsCache = None
 
         self.version = __version__
 
@@ -296,39 +339,136 @@ class PlotModel:
         self.activeView.cells = self.defaultView.cells
         self.activeView.materials = self.defaultView.materials
 
-    def generatePlot(self):
-        """ Spawn thread from which to generate new plot image """
-        t = threading.Thread(target=self.makePlot)
+    def generatePlot(self, spawn_thread=True, view=None):
+        """ Spawn thread from which to generate new plot image
+
+        The plot is computed on the new thread and made current on the
+        calling thread once done.
+
+        Parameters
+        ----------
+        spawn_thread : bool
+            Whether to compute the plot on a new thread. Callers that are
+            already on a worker thread can run it in place.
+        view : PlotView, optional
+            Snapshot of the active view to plot, see makePlot
+        """
+        if not spawn_thread:
+            self.makePlot(view)
+            return
+        results = []
+        t = threading.Thread(
+            target=lambda: results.append(self.computePlot(view)))
         t.start()
         t.join()
+        if results:
+            self.publishPlot(results[0])
+
+    def _getMaps(self, view_params):
+        """ Return the id and property maps of a view, cached by its
+        parameters """
+        # view parameters compare by their repr
+        key = repr(view_params)
+        maps = self._mapCache.get(key)
+        if maps is None:
+            properties = openmc.lib.property_map(view_params)
+            properties[properties < 0.0] = np.nan
+            maps = (openmc.lib.id_map(view_params), properties)
+            self._mapCache[key] = maps
+            if len(self._mapCache) > _MAP_CACHE_SIZE:
+                self._mapCache.popitem(last=False)
+        else:
+            self._mapCache.move_to_end(key)
+        return maps
+
+    def clearMapCache(self):
+        """ Drop the cached id and property maps
 
-    def makePlot(self):
+        Needed whenever the geometry or material properties loaded in
+        openmc.lib change. The maps of the plot on display are kept for
+        pointer lookups, the next plot refetches its maps.
+        """
+        with self._plotLock:
+            self._mapCache.clear()
+            self._idsCache = None
+            self._mapsGeneration += 1
+
+    def makePlot(self, view=None):
         """ Generate new plot image from active view settings
 
         Creates corresponding .xml files from user-chosen settings.
         Runs OpenMC in plot mode to generate new plot image.
+
+        Parameters
+        ----------
+        view : PlotView, optional
+            Copy of the active view to plot, which becomes the current
+            view. Defaults to a copy of the active view.
         """
-        # update/call maps under 2 circumstances
+        self.publishPlot(self.computePlot(view))
+
+    def computePlot(self, view=None):
+        """ Compute the plot image of a view without changing the model
+
+        Safe to run on a worker thread, the returned plot is made current
+        by publishPlot on the GUI thread.
+
+        Parameters
+        ----------
+        view : PlotView, optional
+            Copy of the active view to plot, taken on the GUI thread as
+            the active view may be edited meanwhile. Defaults to a copy of
+            the active view.
+
+        Returns
+        -------
+        PlotResult
+            The plotted view along with its maps, image and data ranges
+        """
+        if view is None:
+            view = copy.deepcopy(self.activeView)
+
+        with self._plotLock:
+            return self._computePlot(view)
+
+    def _computePlot(self, view):
+        generation = self._mapsGeneration
+        ids_map = self.ids_map
+        properties = self.properties
+
+        # update/call maps under 3 circumstances
         #   1. this is the intial plot (ids_map/properties are None)
         #   2. The active (desired) view differs from the current view parameters
-        if (self.currentView.view_params != self.activeView.view_params) or \
-            (self.ids_map is None) or (self.properties is None):
+        #   3. openmc.lib changed since the maps were fetched
+        if (self.currentView.view_params != view.view_params) or \
+            (ids_map is None) or (properties is None) or \
+            self._plotMapsGeneration != generation:
             # get ids from the active (desired) view
-            self.ids_map = openmc.lib.id_map(self.activeView.view_params)
-            self.properties = openmc.lib.property_map(self.activeView.view_params)
+            ids_map, properties = self._getMaps(view.view_params)
 
-        # update current view
-        cv = self.currentView = copy.deepcopy(self.activeView)
+        cv = view
 
         # set model ids based on domain
-        if cv.colorby == 'cell':
-            self.ids = self.cell_ids
+        # ids are kept as a contiguous array for fast per-pixel lookups
+        # and whole-image comparisons
+        by_cell = cv.colorby == 'cell'
+        if by_cell:
             domain = cv.cells
-            source = self.modelCells
         else:
-            self.ids = self.mat_ids
             domain = cv.materials
-            source = self.modelMaterials
+
+        # the ids and their unique values only depend on the maps, so
+        # color, mask and highlight changes skip recomputing them
+        ids_cache = self._idsCache
+        if ids_cache is not None and ids_cache[0] is ids_map and \
+           ids_cache[1] == by_cell:
+            ids, u, inv = ids_cache[2:]
+        else:
+            ids = ids_map[:, :, 0] if by_cell else ids_map[:, :, 2]
+            ids = np.ascontiguousarray(ids, dtype=np.int32)
+            u, inv = np.unique(ids, return_inverse=True)
+            inv = inv.reshape(-1)
+            ids_cache = (ids_map, by_cell, ids, u, inv)
 
         # generate colors if not present
         for cell_id, cell in cv.cells.items():
@@ -342,39 +482,69 @@ class PlotModel:
         # construct image data
         domain[_OVERLAP] = DomainView(_OVERLAP, "Overlap", cv.overlap_color)
         domain[_NOT_FOUND] = DomainView(_NOT_FOUND, "Not Found", cv.domainBackground)
-        u, inv = np.unique(self.ids, return_inverse=True)
-        image = np.array([domain[id].color for id in u])[inv]
-        image.shape = (cv.v_res, cv.h_res, 3)
+        # the image is kept as 8-bit RGB, which matplotlib takes as is
+        # masked and highlighted domains are recolored in the per-id color
+        # table rather than by comparing the whole image for each domain
+        masking = cv.masking
+        highlighting = cv.highlighting
+        colors = []
+        for id in u:
+            dom = domain[id]
+            if highlighting and dom.highlight:
+                colors.append(cv.highlightBackground)
+            elif masking and dom.masked:
+                colors.append(cv.maskBackground)
+            else:
+                colors.append(dom.color)
+        colors = np.array(colors, dtype=np.uint8)
+        # the buffers are only used under the plot lock
+        self._imageBufferIndex ^= 1
+        buffer = self._imageBuffers[self._imageBufferIndex]
+        if buffer is None or buffer.shape != (inv.size, 3):
+            buffer = np.empty((inv.size, 3), dtype=np.uint8)
+            self._imageBuffers[self._imageBufferIndex] = buffer
+        np.take(colors, inv, axis=0, out=buffer)
+        image = buffer.reshape(cv.v_res, cv.h_res, 3)
 
-        if cv.masking:
-            for id, dom in domain.items():
-                if dom.masked:
-                    image[self.ids == int(id)] = cv.maskBackground
+        minmax = {}
+        for prop in _MODEL_PROPERTIES:
+            idx = _PROPERTY_INDICES[prop]
+            prop_data = properties[:, :, idx]
+            minmax[prop] = (np.min(np.nan_to_num(prop_data)),
+                            np.max(np.nan_to_num(prop_data)))
 
-        if cv.highlighting:
-            for id, dom in domain.items():
-                if dom.highlight:
-                    image[self.ids == int(id)] = cv.highlightBackground
+        return PlotResult(cv, ids_map, properties, generation, ids,
+                          ids_cache, image, minmax)
+
+    def publishPlot(self, result):
+        """ Make a plot returned by computePlot the current one
+
+        Must run on the GUI thread, which reads the plot state.
+
+        Parameters
+        ----------
+        result : PlotResult
+            Plot to display
+        """
+        self.currentView = result.view
+        self.ids_map = result.ids_map
+        self.properties = result.properties
+        self._plotMapsGeneration = result.maps_generation
+        self.ids = result.ids
+        # maps fetched before the cache was cleared are not reused
+        if result.maps_generation == self._mapsGeneration:
+            self._idsCache = result.ids_cache
 
         # set model image
-        self.image = image
+        self.image = result.image
 
         # tally data
         self.tally_data = None
 
-        self.properties[self.properties < 0.0] = np.nan
-
         self.temperatures = self.properties[..., _PROPERTY_INDICES['temperature']]
         self.densities = self.properties[..., _PROPERTY_INDICES['density']]
 
-        minmax = {}
-        for prop in _MODEL_PROPERTIES:
-            idx = _PROPERTY_INDICES[prop]
-            prop_data = self.properties[:, :, idx]
-            minmax[prop] = (np.min(np.nan_to_num(prop_data)),
-                            np.max(np.nan_to_num(prop_data)))
-
-        self.activeView.data_minmax = minmax
+        self.activeView.data_minmax = result.minmax
 
     def undo(self):
         """ Revert to previous PlotView instance. Re-generate plot image """
@@ -395,6 +565,10 @@ class PlotModel:
     def storeCurrent(self):
         """ Add current view to previousViews list """
         self.previousViews.append(copy.deepcopy(self.currentView))
+        # each view carries full copies of the cell and material
+        # settings, drop the oldest ones
+        if len(self.previousViews) > _MAX_UNDO_VIEWS:
+            del self.previousViews[:-_MAX_UNDO_VIEWS]
 
     def create_tally_image(self, view: Optional[PlotView] = None):
         """
@@ -1133,6 +1307,25 @@ class DomainTableModel(QAbstractTableModel):
         super().__init__()
         self.domains = [dom for dom in domains.values()]
 
+    def setDomains(self, domains):
+        """ Replace the table contents
+
+        Views are only reset when the number of rows changes, otherwise
+        they keep their scroll position and selection and just repaint.
+        """
+        new_domains = [dom for dom in domains.values()]
+        if len(new_domains) != len(self.domains):
+            self.beginResetModel()
+            self.domains = new_domains
+            self.endResetModel()
+            return
+
+        self.domains = new_domains
+        if new_domains:
+            self.dataChanged.emit(
+                self.index(0, 0),
+                self.index(len(new_domains) - 1, self.columnCount() - 1))
+
     def rowCount(self, index=QModelIndex()):
         return len(self.domains)
 
@@ -1178,10 +1371,12 @@ class DomainTableModel(QAbstractTableModel):
         elif role == Qt.BackgroundRole:
             color = domain.color
             if column == COLOR:
+                # equal colors of other types share the cache entry, key
+                # it on the values QColor takes
                 if isinstance(color, tuple):
-                        return QColor.fromRgb(*color)
+                    return _domainColor(tuple(int(c) for c in color))
                 elif isinstance(color, str):
-                    return QColor.fromRgb(*openmc.plots._SVG_COLORS[color])
+                    return _domainColor(color)
 
         elif role == Qt.CheckStateRole:
             if column == MASK:
@@ -1232,17 +1427,19 @@ class DomainTableModel(QAbstractTableModel):
         column = index.column()
 
         if column == NAME:
-            domain.name = value if value else None
-        elif column == COLOR:
-            domain.color = value
-        elif column == COLORLABEL:
-            domain.color = value
-        elif column == MASK:
-            if role == Qt.CheckStateRole:
-                domain.masked = True if value == Qt.Checked else False
-        elif column == HIGHLIGHT:
-            if role == Qt.CheckStateRole:
-                domain.highlight = True if value == Qt.Checked else False
+            attr, value = 'name', value if value else None
+        elif column in (COLOR, COLORLABEL):
+            attr = 'color'
+        elif column in (MASK, HIGHLIGHT) and role == Qt.CheckStateRole:
+            attr = 'masked' if column == MASK else 'highlight'
+            value = True if value == Qt.Checked else False
+        else:
+            return True
+
+        # rewriting the same value doesn't need the views to repaint
+        if getattr(domain, attr) == value:
+            return True
+        setattr(domain, attr, value)
 
         self.dataChanged.emit(index, index)
         return True
@@ -1251,20 +1448,22 @@ class DomainTableModel(QAbstractTableModel):
 class DomainDelegate(QItemDelegate):
     def __init__(self, parent=None):
         super().__init__(parent)
+        # sample text sizes keyed by (column, font), the same for every row
+        self._sampleSizes = {}
 
     def sizeHint(self, option, index):
 
-        fm = option.fontMetrics
         column = index.column()
 
-        if column == ID:
-            return QSize(fm.boundingRect("XXXXXX").width(), fm.height())
-        elif column == COLOR:
-            return QSize(fm.boundingRect("XXXXXX").width(), fm.height())
-        elif column == COLORLABEL:
-            return QSize(fm.boundingRect("X(XXX, XXX, XXX)X").width(), fm.height())
-        elif column == MASK:
-            return QSize(fm.boundingRect("XXXX").width(), fm.height())
+        if column in _COLUMN_SAMPLE_TEXT:
+            key = (column, option.font.key())
+            size = self._sampleSizes.get(key)
+            if size is None:
+                fm = option.fontMetrics
+                text = _COLUMN_SAMPLE_TEXT[column]
+                size = QSize(fm.boundingRect(text).width(), fm.height())
+                self._sampleSizes[key] = size
+            return QSize(size)
         else:
             return QItemDelegate.sizeHint(self, option, index)
 
@@ -9,6 +9,9 @@ import numpy as np
 # part.
 _float_re = re.compile(r'(([+-]?\d+(\.\d*)?|\.\d+)([eE][+-]?\d+)?)')
 
+# Leading zeros of an exponent, e.g. the "0" in "1e-05"
+_exp_zeros_re = re.compile(r"e(-?)0*(\d+)")
+
 
 class FloatValidator(QtGui.QValidator):
     """
@@ -35,11 +38,16 @@ class ScientificDoubleSpinBox(QDoubleSpinBox):
     """
     Double spin box which allows use of scientific notation
     """
+    # the validator holds no state, so all boxes share one instance
+    _shared_validator = None
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.setMinimum(-np.inf)
         self.setMaximum(np.inf)
-        self.validator = FloatValidator()
+        if ScientificDoubleSpinBox._shared_validator is None:
+            ScientificDoubleSpinBox._shared_validator = FloatValidator()
+        self.validator = ScientificDoubleSpinBox._shared_validator
         self.setDecimals(1000)
 
     def validate(self, text, position):
@@ -53,8 +61,9 @@ class ScientificDoubleSpinBox(QDoubleSpinBox):
 
     def textFromValue(self, value):
         """Modified form of the 'g' format specifier."""
-        flt_str = "{:g}".format(value).replace("e+", "e")
-        flt_str = re.sub(r"e(-?)0*(\d+)", r"e\1\2", flt_str)
+        flt_str = "{:g}".format(value)
+        if "e" in flt_str:
+            flt_str = _exp_zeros_re.sub(r"e\1\2", flt_str.replace("e+", "e"))
         return flt_str
 
     def stepBy(self, steps):
@@ -1,6 +1,8 @@
 import filecmp
 import shutil
 
+from matplotlib.image import imread
+import numpy as np
 import pytest
 
 from openmc_plotter.main_window import MainWindow, _openmcReload
@@ -54,4 +56,36 @@ def test_batch_image(tmpdir, qtbot):
     filecmp.cmp(orig / 'ref.png', tmpdir / 'test.png')
     filecmp.cmp(orig / 'ref1.png', tmpdir / 'test1.png')
 
-    mw.close()
\ No newline at end of file
+    mw.close()
+
+
+def test_batch_image_cached_view(tmpdir, qtbot):
+    orig = tmpdir.chdir()
+
+    shutil.copy2(orig / 'test.pltvw', tmpdir)
+    shutil.copy2(orig / 'test1.pltvw', tmpdir)
+
+    _openmcReload(model_path=orig)
+
+    mw = MainWindow(model_path=orig)
+    mw.loadGui()
+    qtbot.addWidget(mw)
+
+    try:
+        mw.saveBatchImage('test.pltvw')
+        mw.saveBatchImage('test1.pltvw')
+
+        # the maps of this view are cached now
+        with qtbot.waitSignal(mw.plotIm.plotGenerated, timeout=30000):
+            mw.loadViewFile('test.pltvw')
+        assert not mw.plotIm.isGenerating()
+
+        mw.plotIm.saveImage('test_cached')
+    finally:
+        orig.chdir()
+
+    # the images only differ in the metadata of the writer
+    assert np.array_equal(imread(tmpdir / 'test.png'),
+                          imread(tmpdir / 'test_cached.png'))
+
+    mw.close()